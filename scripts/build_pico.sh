@@ -0,0 +1,35 @@
+#!/usr/bin/env bash
+# Precompile the MicroPython code in src/rpi_pico_code to .mpy files for upload to the Pico.
+# Precompiled modules skip parsing and compiling on the device, which saves
+# import time and heap. Needs mpy-cross matching the firmware version
+# (e.g. `pip install mpy-cross==<firmware version>`).
+set -euo pipefail
+
+ROOT_DIR="$(cd "$(dirname "$0")/.." && pwd)"
+SRC_DIR="$ROOT_DIR/src/rpi_pico_code"
+OUT_DIR="${1:-$ROOT_DIR/build/pico}"
+MPY_CROSS="${MPY_CROSS:-$(command -v mpy-cross || true)}"
+# Native/viper functions are compiled to machine code: armv6m for the RP2040
+# (Pico), armv7emsp for the RP2350 (Pico 2)
+MPY_ARCH="${MPY_ARCH:-armv6m}"
+
+if [ -z "$MPY_CROSS" ]; then
+  echo "mpy-cross not found. Install it (pip install mpy-cross) or set MPY_CROSS." >&2
+  exit 1
+fi
+
+mkdir -p "$OUT_DIR"
+
+# -O3: drop assert statements and line number tables (smaller bytecode)
+for src in "$SRC_DIR"/*.py; do
+  name="$(basename "$src" .py)"
+  "$MPY_CROSS" -O3 -march="$MPY_ARCH" -o "$OUT_DIR/$name.mpy" "$src"
+done
+
+# main.py is executed as source at boot, so keep it a one-line stub
+cat > "$OUT_DIR/main.py" <<'PY'
+import follower_bot
+follower_bot.main()
+PY
+
+echo "Upload the contents of $OUT_DIR to the device (e.g. mpremote cp $OUT_DIR/* :)"
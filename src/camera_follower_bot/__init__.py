@@ -0,0 +1,21 @@
+"""Camera Follower Bot host-side package.
+
+Submodules are loaded on first attribute access (PEP 562), so importing the
+package itself does not pull in OpenCV, MediaPipe or pyserial.
+"""
+
+import importlib
+
+_LAZY_SUBMODULES = ("camera_processor", "serial_manager", "logging_config", "run_camera")
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES))
@@ -1,57 +1,208 @@
 import os
 import sys
 import time
+import queue
+import threading
+from collections import namedtuple
 import cv2
 import numpy as np
-import mediapipe as mp
-from mediapipe.tasks import python
-from mediapipe.tasks.python import vision
-from mediapipe import Image, ImageFormat
-from src.camera_follower_bot.serial_manager import SerialManager
+from camera_follower_bot.serial_manager import SerialManager
 
 
 # ---------------------------
 # Configuration / constants
 # ---------------------------
 CAMERA_ID = 0 # Default camera index for OpenCV
+FRAME_WIDTH = 640 # Requested capture width (px)
+FRAME_HEIGHT = 480 # Requested capture height (px)
+CAMERA_FPS = 30 # Requested capture frame rate
 ROTATE_CAMERA = True # Rotate camera image by 180 degrees
 FLIP_CAMERA = True # Flip camera image horizontally
+DETECT_SCALE = 0.5 # Downscale factor applied to frames before face detection (1.0 = full resolution)
 
 HERE = os.path.dirname(__file__)
 MODEL_PATH = os.path.join(HERE, "../../models/blaze_face_short_range.tflite")
+QUANTIZED_MODEL_PATH = os.path.join(HERE, "../../models/blaze_face_short_range_int8.tflite")  # int8 post-training quantized variant
+DELEGATE = "cpu"  # Inference delegate: "cpu" (XNNPACK) or "gpu"
+MIN_DETECTION_CONFIDENCE = 0.6  # Detections below this score are dropped inside the detector
+MIN_SUPPRESSION_THRESHOLD = 0.3  # Overlap above which non-maximum suppression merges boxes
 
-MAX_STDOUT_DISPLAY_LINE_LENGTH = 80  # Maximum characters to display per stdout line
-MAX_STDOUT_DISPLAY_LINE_NUMBERS = 10  # Maximum lines to display of stdout buffer
+MAX_FRAME_GRABS = 2  # Upper bound of grab() calls per frame used to skip stale buffered frames
+FRESH_GRAB_NS = 2_000_000  # A grab() blocking at least this long waited for a new frame, i.e. the buffer is drained
 
+SEND_INTERVAL_NS = 10_000_000  # Minimum time between two position sends (~100Hz)
 
+MOTION_THUMBNAIL_SIZE = (80, 60)  # Grayscale thumbnail used to detect scene changes
+MOTION_THRESHOLD = 2.0  # Mean absolute thumbnail difference below which a frame counts as static
+MOTION_MAX_RESULT_AGE_MS = 500  # Never skip detection once the last result is older than this
+MOTION_REFRESH_FRAMES = 15  # Run detection at least every N frames, even on a static scene
 
+DISPLAY_POLL_S = 0.02  # Longest wait for a new preview frame before HighGUI events are pumped anyway
 
+MAX_STDOUT_DISPLAY_LINE_LENGTH = 80  # Maximum characters to display per stdout line
+MAX_STDOUT_DISPLAY_LINE_NUMBERS = 10  # Maximum lines to display of stdout buffer
 
-def make_face_detector(model_path: str):
-    """Create and return a MediaPipe FaceDetector configured for IMAGE mode.
+# Pre-bound per-frame callables and constants: one global lookup instead of
+# a global plus an attribute lookup on every call in the hot loop
+_rectangle = cv2.rectangle
+_putText = cv2.putText
+_flip = cv2.flip
+_resize = cv2.resize
+_cvtColor = cv2.cvtColor
+_pollKey = cv2.pollKey
+_FONT = cv2.FONT_HERSHEY_SIMPLEX
+_BGR2RGB = cv2.COLOR_BGR2RGB
+_BGR2GRAY = cv2.COLOR_BGR2GRAY
+_INTER_AREA = cv2.INTER_AREA
+
+# MediaPipe dominates the import time of this module (~1s), so it is only
+# imported once a detector or MediaPipe image is needed; see _load_mediapipe()
+mp = None
+_Image = None
+_SRGB = None
+
+# Overlay text templates, filled with C-level %-formatting per frame
+_NOT_CONNECTED_TEXT = "Not connected (Port: %s, Baud: %s) - Press Esc to exit"
+_CONNECTED_TEXT = "Connected - Frames sent: %d - Press Esc to exit"
+_ERROR_TEXT = "Error X: %d px, Error Y: %d px"
+_NO_FACE_TEXT = "No face detected"
+_SCORE_TEXT = "%d%%"
+
+
+
+
+
+def _load_mediapipe():
+    """Import MediaPipe on first use and bind the names used per frame."""
+    global mp, _Image, _SRGB
+    if mp is None:
+        import mediapipe
+        _Image = mediapipe.Image
+        _SRGB = mediapipe.ImageFormat.SRGB
+        mp = mediapipe
+    return mp
+
+
+def make_face_detector(model_path: str, result_callback=None, delegate: str = DELEGATE,
+                       min_detection_confidence: float = MIN_DETECTION_CONFIDENCE,
+                       min_suppression_threshold: float = MIN_SUPPRESSION_THRESHOLD):
+    """Create and return a MediaPipe FaceDetector.
+
+    Without `result_callback` the detector runs in IMAGE mode (synchronous
+    `detect()`). With a callback it runs in LIVE_STREAM mode: frames are
+    submitted via `detect_async()` and results are delivered to
+    `result_callback(result, output_image, timestamp_ms)` from MediaPipe's
+    worker thread, so capture and inference overlap.
 
     Keeping creation in one function makes it easier to swap models or options.
+    `delegate` selects where inference runs: "cpu" uses XNNPACK in recent
+    MediaPipe Tasks releases and is also the fast path for int8 quantized
+    models (see QUANTIZED_MODEL_PATH); "gpu" offloads to the GPU delegate
+    (OpenGL / Metal) where the MediaPipe build supports it.
+
+    `min_detection_confidence` filters weak candidate boxes before
+    non-maximum suppression, so fewer detections are decoded and returned
+    to Python per frame.
     """
+    mp = _load_mediapipe()
     BaseOptions = mp.tasks.BaseOptions
     FaceDetector = mp.tasks.vision.FaceDetector
     FaceDetectorOptions = mp.tasks.vision.FaceDetectorOptions
     VisionRunningMode = mp.tasks.vision.RunningMode
 
+    delegates = {"cpu": BaseOptions.Delegate.CPU, "gpu": BaseOptions.Delegate.GPU}
+    if delegate not in delegates:
+        raise ValueError(f"Unsupported delegate '{delegate}', expected one of: {', '.join(delegates)}")
+
     options = FaceDetectorOptions(
-        base_options=BaseOptions(model_asset_path=model_path),
-        running_mode=VisionRunningMode.IMAGE,
+        base_options=BaseOptions(model_asset_path=model_path, delegate=delegates[delegate]),
+        running_mode=VisionRunningMode.LIVE_STREAM if result_callback is not None else VisionRunningMode.IMAGE,
+        min_detection_confidence=min_detection_confidence,
+        min_suppression_threshold=min_suppression_threshold,
+        result_callback=result_callback,
     )
     detector = FaceDetector.create_from_options(options)
     return detector
 
 
+class LatestDetection:
+    """Thread-safe slot holding the most recent LIVE_STREAM detection result.
+
+    MediaPipe calls `update()` from its own thread; the main loop picks up the
+    newest result with `get()` without waiting for inference to finish.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._result = None
+        self._timestamp_ms = -1
+
+    def update(self, result, output_image, timestamp_ms: int):
+        """Result callback for `make_face_detector` (output_image is unused)."""
+        with self._lock:
+            self._result = result
+            self._timestamp_ms = timestamp_ms
+
+    def get(self):
+        """Return (result, timestamp_ms) of the latest detection, (None, -1) if none yet."""
+        with self._lock:
+            return self._result, self._timestamp_ms
 
-def open_camera(camera_id: int):
+
+
+class MotionGate:
+    """Skip face detection on frames that barely differ from the last detected one.
+
+    Frames are compared as small grayscale thumbnails against the frame that
+    was last sent to the detector (so slow drift still adds up). Detection is
+    only skipped while the previous result is recent and at most
+    `refresh_frames` frames in a row.
+    """
+
+    def __init__(self, threshold: float = MOTION_THRESHOLD, max_result_age_ms: int = MOTION_MAX_RESULT_AGE_MS,
+                 refresh_frames: int = MOTION_REFRESH_FRAMES, thumbnail_size=MOTION_THUMBNAIL_SIZE):
+        self.threshold = threshold
+        self.max_result_age_ms = max_result_age_ms
+        self.refresh_frames = refresh_frames
+        self.thumbnail_size = thumbnail_size
+        self._reference = None
+        self._skipped = 0
+
+    def should_detect(self, frame, result_age_ms: int) -> bool:
+        """Return True if frame should go to the detector.
+
+        result_age_ms is the age of the newest detection result (negative if none yet).
+        """
+        thumbnail = _cvtColor(_resize(frame, self.thumbnail_size, interpolation=_INTER_AREA), _BGR2GRAY)
+        if (self._reference is not None
+                and 0 <= result_age_ms <= self.max_result_age_ms
+                and self._skipped < self.refresh_frames
+                and cv2.absdiff(self._reference, thumbnail).mean() < self.threshold):
+            self._skipped += 1
+            return False
+        self._reference = thumbnail
+        self._skipped = 0
+        return True
+
+
+
+def open_camera(camera_id: int, width: int = FRAME_WIDTH, height: int = FRAME_HEIGHT, fps: int = CAMERA_FPS):
     """Open camera and return capture plus frame center coordinates.
 
+    Requests MJPG at the given resolution / frame rate: many webcams default
+    to uncompressed YUYV at full resolution, which saturates USB and makes
+    every later stage process more pixels. The driver may pick the closest
+    supported mode, so the actual frame size is read back.
+
     Returns: (cap, frame_width, frame_height, center_x, center_y)
     """
     cap = cv2.VideoCapture(camera_id)
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    cap.set(cv2.CAP_PROP_FPS, fps)
+    # Keep at most one queued frame so reads stay close to "now" (not all backends honor this)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
     frame_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
     frame_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
     center_x = frame_width // 2
@@ -59,176 +210,408 @@ def open_camera(camera_id: int):
     return cap, frame_width, frame_height, center_x, center_y
 
 
+def read_latest_frame(cap, max_grabs: int = MAX_FRAME_GRABS, fresh_grab_ns: int = FRESH_GRAB_NS):
+    """Read the most recent frame, dropping stale frames queued by the driver.
 
+    grab() is cheap (no decode): frames that are already buffered return
+    immediately and are skipped, while a grab() that blocks for at least
+    fresh_grab_ns had to wait for the camera and is therefore current. At
+    most max_grabs frames are grabbed, then only the last one is decoded via
+    retrieve(). Returns (ret, frame) like cap.read().
+    """
+    monotonic_ns = time.monotonic_ns
+    for _ in range(max_grabs):
+        start_ns = monotonic_ns()
+        if not cap.grab():
+            return False, None
+        if monotonic_ns() - start_ns >= fresh_grab_ns:
+            break
+    return cap.retrieve()
 
-def process_frame(frame, detector, center_x, center_y, rotate_camera: bool = ROTATE_CAMERA, flip_camera: bool = FLIP_CAMERA):
-    """Process a BGR OpenCV frame, run face detection and return (annotated_frame, error_x, error_y).
 
-    Steps:
-    - rotate / flip to match camera orientation (parametrizable)
-    - convert BGR->RGB and build MediaPipe Image
-    - detect faces and annotate frame with bbox + confidence
-    - compute pixel error relative to frame center
+
+
+def orientation_flip_code(rotate_camera: bool, flip_camera: bool):
+    """Return the single cv2.flip code equivalent to rotate / flip, or None if neither is set.
+
+    A 180 degree rotation flips both axes, so combined with a horizontal flip
+    it collapses to a vertical flip and the frame is only touched once.
     """
-    # Normalize orientation to match how the camera is mounted
+    if rotate_camera and flip_camera:
+        return 0
     if rotate_camera:
-        frame = cv2.rotate(frame, cv2.ROTATE_180)
+        return -1
     if flip_camera:
-        frame = cv2.flip(frame, 1)
+        return 1
+    return None
+
+
+def orient_frame(frame, rotate_camera: bool = ROTATE_CAMERA, flip_camera: bool = FLIP_CAMERA):
+    """Rotate / flip a BGR frame to match how the camera is mounted."""
+    flip_code = orientation_flip_code(rotate_camera, flip_camera)
+    if flip_code is None:
+        return frame
+    return _flip(frame, flip_code)
+
+
+def downscale_frame(frame, detect_scale: float = DETECT_SCALE, dst=None):
+    """Shrink frame by detect_scale for inference; returns frame itself at scale 1.0.
+
+    BlazeFace works on a 128x128 input, so full-resolution frames only cost
+    extra color conversion and resizing work inside the graph.
+    """
+    if detect_scale == 1.0:
+        return frame
+    height, width = frame.shape[:2]
+    size = (int(width * detect_scale), int(height * detect_scale))
+    return _resize(frame, size, dst=dst, interpolation=_INTER_AREA)
+
 
+def to_mp_image(frame, rgb_buffer=None):
+    """Convert a BGR OpenCV frame into a MediaPipe SRGB Image.
+
+    If `rgb_buffer` (uint8 array shaped like frame) is given, the conversion
+    writes into it instead of allocating a new full-frame array; passing the
+    frame itself converts in place. MediaPipe copies the pixels into its own
+    Image (it cannot wrap a NumPy buffer), so the buffer can be reused for
+    the next frame right away.
+    """
     # Convert BGR to RGB for mediapipe
-    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    rgb = _cvtColor(frame, _BGR2RGB, dst=rgb_buffer)
 
     # OpenCV-Frame → MediaPipe Image
-    mp_image = Image(image_format=ImageFormat.SRGB, data=rgb)
+    if _Image is None:
+        _load_mediapipe()
+    return _Image(image_format=_SRGB, data=rgb)
 
-    # Run face detection (returns a DetectionResults object)
-    results = detector.detect(mp_image)
-
-    error_x = None
-    error_y = None
-
-    # Draw detections and compute offsets if any faces found
-    if results.detections:
-        for detection in results.detections:
-            bbox = detection.bounding_box
-
-            # Draw bounding box
-            cv2.rectangle(
-                frame,
-                (bbox.origin_x, bbox.origin_y),
-                (bbox.origin_x + bbox.width, bbox.origin_y + bbox.height),
-                (0, 255, 0),
-                2,
-            )
 
-            # Draw confidence label (first category)
-            score = detection.categories[0].score
-            label = f"{score:.2f}"
-            cv2.putText(
-                frame,
-                label,
-                (bbox.origin_x, max(10, bbox.origin_y - 5)),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.5,
-                (0, 255, 0),
-                1,
-            )
+def _detection_score(detection):
+    return detection.categories[0].score
 
-            # Compute bounding box center
-            face_x = int((bbox.origin_x + bbox.width / 2))
-            face_y = int((bbox.origin_y + bbox.height / 2))
 
-            # Pixel error: positive means target is left/up relative to center
-            error_x = center_x - face_x
-            error_y = center_y - face_y
+def select_target(detections):
+    """Return the single face to track: the detection with the highest score.
+
+    Returns None if there are no detections. The bot follows one face, so any
+    further detections are neither drawn nor used for the error.
+    """
+    if not detections:
+        return None
+    if len(detections) == 1:
+        return detections[0]
+    return max(detections, key=_detection_score)
 
-            # (optional) draw a red dot at face center
-            # cv2.circle(frame, (face_x, face_y), 5, (0, 0, 255), -1)
 
+def draw_target(frame, target, detect_scale: float = 1.0):
+    """Draw bounding box and confidence label of the tracked face onto frame.
+
+    The bounding box is in detector-input coordinates and is scaled back up
+    by 1 / detect_scale.
+    """
+    if target is None:
+        return frame
+    inv_scale = 1.0 / detect_scale
+    bbox = target.bounding_box
+    x = int(bbox.origin_x * inv_scale)
+    y = int(bbox.origin_y * inv_scale)
+
+    # Draw bounding box
+    _rectangle(
+        frame,
+        (x, y),
+        (int((bbox.origin_x + bbox.width) * inv_scale), int((bbox.origin_y + bbox.height) * inv_scale)),
+        (0, 255, 0),
+        2,
+    )
+
+    # Draw confidence label (first category) as integer percent
+    label = _SCORE_TEXT % (_detection_score(target) * 100)
+    _putText(
+        frame,
+        label,
+        (x, max(10, y - 5)),
+        _FONT,
+        0.5,
+        (0, 255, 0),
+        1,
+    )
+
+    # (optional) draw a red dot at face center
+    # cv2.circle(frame, (face_x, face_y), 5, (0, 0, 255), -1)
+    return frame
+
+
+def compute_error(target, center_x, center_y, detect_scale: float = 1.0):
+    """Return pixel error (error_x, error_y) of the tracked face relative to the frame center.
+
+    The bounding box is scaled back to full-frame pixels by 1 / detect_scale.
+    Returns (None, None) if there is no target.
+    """
+    if target is None:
+        return None, None
+    inv_scale = 1.0 / detect_scale
+    bbox = target.bounding_box
+
+    # Compute bounding box center
+    face_x = int((bbox.origin_x + bbox.width / 2) * inv_scale)
+    face_y = int((bbox.origin_y + bbox.height / 2) * inv_scale)
+
+    # Pixel error: positive means target is left/up relative to center
+    return center_x - face_x, center_y - face_y
+
+
+def annotate_detections(frame, detections, center_x, center_y, detect_scale: float = 1.0):
+    """Draw the tracked face onto frame and return (annotated_frame, error_x, error_y).
+
+    error_x / error_y are None if there are no detections.
+    """
+    target = select_target(detections)
+    draw_target(frame, target, detect_scale)
+    error_x, error_y = compute_error(target, center_x, center_y, detect_scale)
     return frame, error_x, error_y
 
 
+def process_frame(frame, detector, center_x, center_y, rotate_camera: bool = ROTATE_CAMERA, flip_camera: bool = FLIP_CAMERA,
+                  detect_scale: float = DETECT_SCALE):
+    """Process a BGR OpenCV frame, run face detection and return (annotated_frame, error_x, error_y).
+
+    Synchronous variant for IMAGE mode detectors. Steps:
+    - rotate / flip to match camera orientation (parametrizable)
+    - downscale by detect_scale, convert BGR->RGB and build MediaPipe Image
+    - detect faces and annotate the full-resolution frame with bbox + confidence
+    - compute pixel error relative to frame center
+    """
+    frame = orient_frame(frame, rotate_camera, flip_camera)
+
+    # Run face detection (returns a DetectionResults object)
+    results = detector.detect(to_mp_image(downscale_frame(frame, detect_scale)))
+
+    return annotate_detections(frame, results.detections, center_x, center_y, detect_scale)
+
+
+# Everything the display needs to annotate one frame, produced by the tracking loop
+Overlay = namedtuple('Overlay', ['target', 'error_x', 'error_y', 'connected', 'frames_sent', 'stdout_lines'])
+
+
+def render_overlay(frame, overlay, port, baud, detect_scale: float = 1.0):
+    """Draw the tracked face, connection status, tracking error and device stdout onto frame."""
+    draw_target(frame, overlay.target, detect_scale)
+
+    if not overlay.connected:
+        # Show human-friendly error text on frame
+        _putText(
+            img=frame,
+            text=_NOT_CONNECTED_TEXT % (port, baud),
+            org=(10, 25),
+            color=(0, 0, 255),
+            fontFace=_FONT,
+            fontScale=0.7)
+    else:
+        _putText(
+            img=frame,
+            text=_CONNECTED_TEXT % overlay.frames_sent,
+            org=(10, 25),
+            color=(255, 255, 255),
+            fontFace=_FONT,
+            fontScale=0.7)
+
+    if overlay.error_x is not None and overlay.error_y is not None:
+        # Show human-friendly error text on frame
+        text = _ERROR_TEXT % (overlay.error_x, overlay.error_y)
+    else:
+        text = _NO_FACE_TEXT
+
+    # Display detection results
+    _putText(
+        img=frame,
+        text=text,
+        org=(10, frame.shape[0] - 20),
+        color=(255, 255, 255),
+        fontFace=_FONT,
+        fontScale=0.7,
+    )
+
+    # Display stdout from the device (last MAX_STDOUT_DISPLAY_LINES lines)
+    if overlay.stdout_lines:
+        y_offset = 80  # Start below connection status
+        for idx, line in enumerate(overlay.stdout_lines):
+            # Truncate long lines to fit on screen
+            _putText(
+                img=frame,
+                text=line[:MAX_STDOUT_DISPLAY_LINE_LENGTH],
+                org=(10, y_offset + idx * 20),
+                color=(255, 255, 255) if overlay.connected else (100, 100, 100),
+                fontFace=_FONT,
+                fontScale=0.7,
+            )
+    return frame
+
+
+def offer_latest(q, item):
+    """Put item into a size-1 queue, replacing an entry the consumer has not taken yet."""
+    try:
+        q.get_nowait()
+    except queue.Empty:
+        pass
+    try:
+        q.put_nowait(item)
+    except queue.Full:
+        pass
+
+
 def main():
     # Serial manager handles reconnects with backoff
     serial_mgr = SerialManager()
     # Try an immediate connect
     serial_mgr.connect()
-    last_send = 0
 
-    # Create face detector
-    detector = make_face_detector(MODEL_PATH)
+    # Create face detector in LIVE_STREAM mode; results land in `latest`
+    latest = LatestDetection()
+    detector = make_face_detector(MODEL_PATH, result_callback=latest.update, delegate=DELEGATE,
+                                  min_detection_confidence=MIN_DETECTION_CONFIDENCE)
 
     # Open camera and compute center
-    cap, frame_width, frame_height, center_x, center_y = open_camera(CAMERA_ID)
-
-    frames_sent_since_reconnect = 0
+    cap, frame_width, frame_height, center_x, center_y = open_camera(CAMERA_ID, FRAME_WIDTH, FRAME_HEIGHT, CAMERA_FPS)
+
+    # Orientation is fixed for the session, resolve it to one flip up front
+    flip_code = orientation_flip_code(ROTATE_CAMERA, FLIP_CAMERA)
+
+    # Skips inference on frames where nothing moved
+    motion_gate = MotionGate()
+
+    # Inference input size and the buffer reused for every downscale / BGR->RGB
+    # conversion. When downscaling, the resized frame is our own buffer and is
+    # converted to RGB in place; at full scale the frame is still needed for
+    # display, so a separate RGB buffer is used.
+    detect_scale = DETECT_SCALE
+    detect_shape = (int(frame_height * detect_scale), int(frame_width * detect_scale), 3)
+    small_buffer = np.empty(detect_shape, dtype=np.uint8) if detect_scale != 1.0 else None
+    rgb_buffer = small_buffer if small_buffer is not None else np.empty(detect_shape, dtype=np.uint8)
+
+    # Tracking runs on a worker thread and hands (frame, overlay) to the display,
+    # which stays on the main thread (HighGUI requires it on macOS). A slow
+    # display only drops preview frames; it never throttles tracking.
+    display_queue = queue.Queue(maxsize=1)
+    stop = threading.Event()
+    tracking_errors = []
+
+    def track():
+        last_send_ns = 0
+        last_submit_ms = -1
+        last_result_ms = -1
+        frames_sent_since_reconnect = 0
+        try:
+            # Bound methods used every iteration, resolved once; inside the
+            # try so a missing method is reported and stops the display too
+            detect_async = detector.detect_async
+            get_latest = latest.get
+            is_connected = serial_mgr.is_connected
+            reconnect_if_needed = serial_mgr.reconnect_if_needed
+            send_position = serial_mgr.send_position
+            flush_if_due = serial_mgr.flush_if_due
+            read_stdout = serial_mgr.read_stdout
+            get_stdout_buffer = serial_mgr.get_stdout_buffer
+            monotonic_ns = time.monotonic_ns
+
+            while cap.isOpened() and not stop.is_set():
+                ret, frame = read_latest_frame(cap)
+                if not ret:
+                    break
+
+                if flip_code is not None:
+                    frame = _flip(frame, flip_code)
+
+                # Submit the frame for inference and carry on with the newest result
+                # available; MediaPipe requires strictly increasing timestamps.
+                now_ns = monotonic_ns()
+                now_ms = now_ns // 1_000_000
+                small = downscale_frame(frame, detect_scale, small_buffer)
+                results, result_ms = get_latest()
+                result_age_ms = now_ms - result_ms if result_ms >= 0 else -1
+                if motion_gate.should_detect(small, result_age_ms):
+                    submit_ms = max(now_ms, last_submit_ms + 1)
+                    detect_async(to_mp_image(small, rgb_buffer), submit_ms)
+                    last_submit_ms = submit_ms
+
+                target = select_target(results.detections) if results is not None else None
+                error_x, error_y = compute_error(target, center_x, center_y, detect_scale)
+
+                # Only a new result is fresh tracking information; resending an old one
+                # would make the robot correct the same error several times.
+                new_result = result_ms != last_result_ms
+                last_result_ms = result_ms
+
+                # Attempt non-blocking reconnects only while disconnected
+                connected = is_connected()
+                if not connected:
+                    reconnect_if_needed(now_ns * 1e-9)
+                    connected = is_connected()
+                    if not connected:
+                        frames_sent_since_reconnect = 0
+
+                if error_x is not None and error_y is not None:
+                    # Throttle serial sending to ~100Hz
+                    if new_result and now_ns - last_send_ns >= SEND_INTERVAL_NS:
+                        # send via manager (will silently drop if disconnected)
+                        send_position(error_x, error_y)
+                        last_send_ns = now_ns
+                        frames_sent_since_reconnect += 1
+                # Deliver positions still buffered from earlier sends even when
+                # no new result arrives (face lost, static scene)
+                flush_if_due(now_ns)
+
+                # Read any available stdout from the device
+                read_stdout()
+                stdout_lines = get_stdout_buffer(max_lines=MAX_STDOUT_DISPLAY_LINE_NUMBERS)
+
+                overlay = Overlay(target, error_x, error_y, connected, frames_sent_since_reconnect, stdout_lines)
+                offer_latest(display_queue, (frame, overlay))
+        except Exception as exc:
+            tracking_errors.append(exc)
+        finally:
+            stop.set()
+
+    tracker = threading.Thread(target=track, name='face-tracker', daemon=True)
+    tracker.start()
+
+    # Annotations are drawn on a copy in this reused buffer so camera frames
+    # stay untouched (they may still be referenced by the tracking side)
+    display_buf = np.empty((frame_height, frame_width, 3), dtype=np.uint8)
 
     try:
-        while cap.isOpened():
-            ret, frame = cap.read()
-            if not ret:
-                break
-
-            annotated, error_x, error_y = process_frame(frame, detector, center_x, center_y, ROTATE_CAMERA, FLIP_CAMERA)
-
-            # Attempt non-blocking reconnects if needed
-            serial_mgr.reconnect_if_needed()
-            
-            if not serial_mgr.is_connected():
-                # Show human-friendly error text on frame
-                frames_sent_since_reconnect = 0
-                cv2.putText(
-                    img=annotated,
-                    text=f"Not connected (Port: {serial_mgr.port}, Baud: {serial_mgr.baud}) - Press Esc to exit",
-                    org=(10, 25),
-                    color=(0, 0, 255),
-                    fontFace=cv2.FONT_HERSHEY_SIMPLEX,
-                    fontScale=0.7)
-            else:
-                cv2.putText(
-                    img=annotated,
-                    text=f"Connected - Frames sent: {frames_sent_since_reconnect} - Press Esc to exit",
-                    org=(10, 25),
-                    color=(255, 255, 255),
-                    fontFace=cv2.FONT_HERSHEY_SIMPLEX,
-                    fontScale=0.7)
-
-            if error_x is not None and error_y is not None:
-
-                # Show human-friendly error text on frame
-                text = f"Error X: {error_x} px, Error Y: {error_y} px"
-
-                # Throttle serial sending to ~100Hz
-                now = time.time()
-                if now - last_send >= 0.01:
-                    # send via manager (will silently drop if disconnected)
-                    serial_mgr.send_position(error_x, error_y)
-                    last_send = now
-                    frames_sent_since_reconnect += 1
-            else:
-               text = f"No face detected"
-                 
-            # Display detection results
-            cv2.putText(
-                img=annotated,
-                text=text,
-                org=(10, frame_height - 20),
-                color=(255, 255, 255),
-                fontFace=cv2.FONT_HERSHEY_SIMPLEX,
-                fontScale=0.7,
-            )
-
-            # Read any available stdout from the device
-            serial_mgr.read_stdout()
-
-            # Display stdout from the device (last MAX_STDOUT_DISPLAY_LINES lines)
-            stdout_lines = serial_mgr.get_stdout_buffer(max_lines=MAX_STDOUT_DISPLAY_LINE_NUMBERS)
-            if stdout_lines:
-                y_offset = 80  # Start below connection status
-                for idx, line in enumerate(stdout_lines):
-                    # Truncate long lines to fit on screen
-                    display_line = line[:MAX_STDOUT_DISPLAY_LINE_LENGTH] if len(line) > MAX_STDOUT_DISPLAY_LINE_LENGTH else line
-                    cv2.putText(
-                        img=annotated,
-                        text=display_line,
-                        org=(10, y_offset + idx * 20),
-                        color=(255, 255, 255) if serial_mgr.is_connected() else (100, 100, 100),
-                        fontFace=cv2.FONT_HERSHEY_SIMPLEX,
-                        fontScale=0.7,
-                    )
-
-            # Display the annotated frame
-            cv2.imshow('Mediapipe Face Tracking', annotated)
-
-            if cv2.waitKey(1) & 0xFF == 27:  # ESC to quit
+        while not stop.is_set():
+            # Waiting on the queue paces this loop; HighGUI events are pumped
+            # with the non-blocking pollKey() instead of waitKey(1), which
+            # would add a 1ms sleep to every displayed frame
+            try:
+                frame, overlay = display_queue.get(timeout=DISPLAY_POLL_S)
+            except queue.Empty:
+                frame = None
+
+            if frame is not None:
+                if display_buf.shape != frame.shape:
+                    # The driver delivered a different size than it reported
+                    display_buf = np.empty_like(frame)
+                np.copyto(display_buf, frame)
+                annotated = render_overlay(display_buf, overlay, serial_mgr.port, serial_mgr.baud, detect_scale)
+
+                # Display the annotated frame
+                cv2.imshow('Mediapipe Face Tracking', annotated)
+
+            if _pollKey() & 0xFF == 27:  # ESC to quit
                 break
     finally:
+        stop.set()
+        tracker.join()
         # Gracefully close serial connection (will relax servos)
         serial_mgr.close()
+        detector.close()
         cap.release()
         cv2.destroyAllWindows()
 
+    if tracking_errors:
+        raise tracking_errors[0]
+
 
 if __name__ == '__main__':
     main()
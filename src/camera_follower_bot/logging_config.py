@@ -10,7 +10,7 @@ It supports:
 import logging
 import os
 import sys
-from typing import Optional
+from typing import Optional, Union
 
 
 # Default configuration
@@ -24,7 +24,7 @@ DEFAULT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 def setup_logging(
     name: Optional[str] = None,
-    level: Optional[int] = None,
+    level: Optional[Union[int, str]] = None,
     log_file: Optional[str] = None,
     format_string: Optional[str] = None,
     date_format: Optional[str] = None,
@@ -33,7 +33,8 @@ def setup_logging(
     
     Args:
         name: Logger name (typically __name__). If None, returns root logger.
-        level: Log level (e.g., logging.INFO). If None, uses environment variable or default.
+        level: Log level (e.g., logging.INFO) or its name (e.g., "INFO", case insensitive).
+            If None or an unknown name, uses the default.
         log_file: Path to log file. If None, uses LOG_FILE env var. If still None, logs to stdout only.
         format_string: Custom log format string. If None, uses default format.
         date_format: Custom date format string. If None, uses default format.
@@ -49,7 +50,10 @@ def setup_logging(
         return logger
     
     # Determine log level
-    if level is None:
+    if isinstance(level, str):
+        # getLevelName maps known names to their number and returns a str otherwise
+        level = logging.getLevelName(level.upper())
+    if not isinstance(level, int):
         level = DEFAULT_LOG_LEVEL
     logger.setLevel(level)
     
@@ -4,18 +4,24 @@
 This script uses argparse to configure:
  - serial port device
  - baud rate
- - model path
- - camera id
+ - model path (optionally the int8 quantized model) and inference delegate
+ - camera id and capture resolution / frame rate
  - --no-serial flag to run without hardware (useful for testing)
 
 It patches the `CameraProcessor` module at runtime so the existing
 `CameraProcessor.main()` can be used without modifying its signature.
 """
 import argparse
+import importlib.util
+import platform
 import sys
 import os
-## Logger is now set up after parsing CLI args in main()
-logger = None
+# Only stdlib is imported at module level: logging setup, the dependency
+# check and the heavy camera modules are all deferred into main(), after
+# argument parsing, so --help and usage errors return immediately.
+
+LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+ARM_MACHINES = ('arm', 'aarch64')  # platform.machine() prefixes of ARM CPUs
 
 
 def build_parser():
@@ -23,55 +29,92 @@ def build_parser():
     p.add_argument('--serial-port', help='Serial device path')
     p.add_argument('--baud', type=int, help='Serial baud rate')
     p.add_argument('--model-path', help='Path to the MediaPipe TFLite model')
+    p.add_argument('--quantized', dest='quantized', default=None, action='store_true', help='Use the int8 quantized model (ignored if --model-path is given; default: on ARM CPUs if the model file exists)')
+    p.add_argument('--no-quantized', dest='quantized', action='store_false', help='Use the float model even on ARM CPUs')
+    p.add_argument('--delegate', choices=['cpu', 'gpu'], help='Inference delegate for the face detector (default: cpu)')
+    p.add_argument('--min-confidence', type=float, help='Minimum face detection confidence between 0 and 1 (default: 0.6)')
     p.add_argument('--camera-id', type=int, help='Camera device id (integer passed to OpenCV)')
+    p.add_argument('--width', type=int, help='Requested capture width in pixels (default: 640)')
+    p.add_argument('--height', type=int, help='Requested capture height in pixels (default: 480)')
+    p.add_argument('--fps', type=int, help='Requested capture frame rate (default: 30)')
+    p.add_argument('--forward-serial-stdio', action='store_true', help='Echo every line the device prints to stdout')
     p.add_argument('--no-serial', action='store_true', help='Run without serial hardware (for testing)')
     p.add_argument('--rotate180', dest='rotate180', default=None, action='store_true', help='Rotate camera image by 180 degrees (default: enabled)')
     p.add_argument('--no-rotate180', dest='rotate180', action='store_false', help='Do not rotate camera image by 180 degrees')
     p.add_argument('--flip', dest='flip', default=None, action='store_true', help='Flip camera image horizontally (default: enabled)')
     p.add_argument('--no-flip', dest='flip', action='store_false', help='Do not flip camera image horizontally')
-    p.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'], help='Set logging level')
+    p.add_argument('--log-level', type=str.upper, choices=LOG_LEVELS, help='Set logging level')
     p.add_argument('--log-file', help='Path to log file (default: stdout only)')
     return p
 
 
+def prefer_quantized_model(quantized_path: str, machine: str = None) -> bool:
+    """Return True if the int8 model should be used by default.
+
+    int8 inference is about twice as fast as float32 on ARM CPUs (e.g. a
+    Raspberry Pi) but can be slower on x86, so it is only preferred on ARM
+    and only if the quantized model file exists.
+    """
+    machine = (machine if machine is not None else platform.machine()).lower()
+    return machine.startswith(ARM_MACHINES) and os.path.isfile(quantized_path)
+
+
 class DummySerialManager:
     """A no-op SerialManager used when --no-serial is selected.
 
     Implements the minimal methods used by CameraProcessor so the
     main loop runs but no data is sent.
     """
-    def __init__(self, *args, **kwargs):
-        pass
+    def __init__(self, *args, logger_instance=None, **kwargs):
+        self.logger = logger_instance
+        # shown by the "Not connected" overlay
+        self.port = 'no-serial'
+        self.baud = None
 
     def connect(self):
         return True
 
-    def reconnect_if_needed(self):
+    def reconnect_if_needed(self, now=None):
         return None
 
     def is_connected(self):
         return False
 
+    def write(self, data):
+        return False
+
     def send_position(self, error_x, error_y):
-        if logger:
-            logger.debug(f"[no-serial] {error_x},{error_y}")
+        if self.logger:
+            self.logger.debug(f"[no-serial] {error_x},{error_y}")
+        return True
+
+    def flush_if_due(self, now_ns=None):
+        return True
+
+    def flush(self):
         return True
     
     def read_stdout(self):
         return False
+
+    def drain_input(self):
+        return False
     
     def get_stdout_buffer(self, max_lines=None):
         return []
     
     def clear_stdout_buffer(self):
         pass
+
+    def send_relax_command(self, timeout=None):
+        return False
     
     def close(self):
         """No-op close for dummy serial manager."""
         pass
 
 
-def validate_model_path(path: str):
+def validate_model_path(path: str, logger=None):
     """Validate that the TFLite model exists and provide helpful instructions if not.
 
     If the model file is missing, log guidance where to obtain compatible
@@ -90,47 +133,56 @@ def validate_model_path(path: str):
         sys.exit(2)
 
 
+MODELS_HELP = """
+How to obtain a compatible MediaPipe face detection model:
+ - Use MediaPipe BlazeFace TFLite models (short/long range as needed).
+ - Example sources:
+     * https://github.com/google/mediapipe (search for blaze_face tflite assets)
+     * Prebuilt TFLite files sometimes live on model zips or sample repos
+ - Place the .tflite file locally and pass its path via --model-path or set MODEL_PATH.
+ - If you use `run_camera.py`, pass --model-path /path/to/blaze_face_short_range.tflite
+
+"""
+
+MISSING_PACKAGES_HELP = """
+Missing required Python packages:
+{packages}
+
+Install dependencies with:
+  pip install -r requirements.txt
+
+Or install missing packages directly, for example:
+  pip install {install}
+
+If you need a ready set of pinned versions, see requirements.txt in this repo.
+"""
+
+
 def print_help_for_models():
-    print("\nHow to obtain a compatible MediaPipe face detection model:")
-    print(" - Use MediaPipe BlazeFace TFLite models (short/long range as needed).")
-    print(" - Example sources:")
-    print("     * https://github.com/google/mediapipe (search for blaze_face tflite assets)")
-    print("     * Prebuilt TFLite files sometimes live on model zips or sample repos")
-    print(" - Place the .tflite file locally and pass its path via --model-path or set MODEL_PATH.")
-    print(" - If you use `run_camera.py`, pass --model-path /path/to/blaze_face_short_range.tflite")
-    print("")
+    # Error guidance goes to stderr in a single write
+    sys.stderr.write(MODELS_HELP)
 
 
-def check_dependencies():
+def check_dependencies(logger=None):
+    # Only locate the packages: importing them here (MediaPipe in particular)
+    # would pay their full import time before anything else can start
     missing = []
-    try:
-        import cv2  # noqa: F401
-    except Exception:
-        missing.append('opencv-python')
-    try:
-        import mediapipe  # noqa: F401
-    except Exception:
-        missing.append('mediapipe')
-    try:
-        import numpy  # noqa: F401
-    except Exception:
-        missing.append('numpy')
-    try:
-        import serial  # noqa: F401
-    except Exception:
-        missing.append('pyserial')
+    for module, package in (('cv2', 'opencv-python'), ('mediapipe', 'mediapipe'),
+                            ('numpy', 'numpy'), ('serial', 'pyserial')):
+        try:
+            found = importlib.util.find_spec(module) is not None
+        except Exception:
+            found = False
+        if not found:
+            missing.append(package)
 
     if missing:
         if logger:
             logger.error('Missing required Python packages: %s', ', '.join(missing))
-        print('\nMissing required Python packages:')
-        for pkg in missing:
-            print(' -', pkg)
-        print('\nInstall dependencies with:')
-        print('  pip install -r requirements.txt')
-        print('\nOr install missing packages directly, for example:')
-        print('  pip install ' + ' '.join(missing))
-        print('\nIf you need a ready set of pinned versions, see requirements.txt in this repo.')
+        sys.stderr.write(MISSING_PACKAGES_HELP.format(
+            packages='\n'.join(' - ' + pkg for pkg in missing),
+            install=' '.join(missing),
+        ))
         sys.exit(3)
 
 
@@ -139,40 +191,43 @@ def main(argv=None):
     parser = build_parser()
     args = parser.parse_args(argv)
 
-    # Setup logging with CLI args
-    import logging
+    # Setup logging with CLI args; the level name is resolved by setup_logging
     from camera_follower_bot import logging_config
-    log_level_str = args.log_level.upper() if args.log_level else None
-    log_file = args.log_file
-    level_map = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-        "CRITICAL": logging.CRITICAL,
-    }
-    if log_level_str is None:
-        log_level = logging_config.DEFAULT_LOG_LEVEL
-    else:
-        log_level = level_map.get(log_level_str, logging_config.DEFAULT_LOG_LEVEL)
-    # Reconfigure logger
-    global logger
-    logger = logging_config.setup_logging(__name__, level=log_level, log_file=log_file)
+    logger = logging_config.setup_logging(__name__, level=args.log_level, log_file=args.log_file)
 
     # Quick dependency check before importing heavy modules.
-    check_dependencies()
+    check_dependencies(logger)
 
     # Import here so CLI parsing works quickly even if heavy deps are missing
-    import src.camera_follower_bot.camera_processor as camera_processor
-    import src.camera_follower_bot.serial_manager as SM
+    import camera_follower_bot.camera_processor as camera_processor
+    import camera_follower_bot.serial_manager as SM
 
     # Override model path and camera id if provided
     if args.model_path is not None:
         logger.info("Setting MODEL_PATH to %s", args.model_path)
         camera_processor.MODEL_PATH = args.model_path
+    elif args.quantized or (args.quantized is None
+                            and prefer_quantized_model(camera_processor.QUANTIZED_MODEL_PATH)):
+        logger.info("Setting MODEL_PATH to quantized model %s", camera_processor.QUANTIZED_MODEL_PATH)
+        camera_processor.MODEL_PATH = camera_processor.QUANTIZED_MODEL_PATH
+    if args.delegate is not None:
+        logger.info("Setting DELEGATE to %s", args.delegate)
+        camera_processor.DELEGATE = args.delegate
+    if args.min_confidence is not None:
+        logger.info("Setting MIN_DETECTION_CONFIDENCE to %s", args.min_confidence)
+        camera_processor.MIN_DETECTION_CONFIDENCE = args.min_confidence
     if args.camera_id is not None:
         logger.info("Setting CAMERA_ID to %s", args.camera_id)
         camera_processor.CAMERA_ID = args.camera_id
+    if args.width is not None:
+        logger.info("Setting FRAME_WIDTH to %s", args.width)
+        camera_processor.FRAME_WIDTH = args.width
+    if args.height is not None:
+        logger.info("Setting FRAME_HEIGHT to %s", args.height)
+        camera_processor.FRAME_HEIGHT = args.height
+    if args.fps is not None:
+        logger.info("Setting CAMERA_FPS to %s", args.fps)
+        camera_processor.CAMERA_FPS = args.fps
     # Set static attributes for process_frame
     if args.rotate180 is not None:
         logger.info("Setting ROTATE_CAMERA to %s", args.rotate180)
@@ -184,23 +239,33 @@ def main(argv=None):
     # Patch SerialManager used within CameraProcessor
     if args.no_serial:
         logger.info("Running without serial hardware (no-serial mode)")
-        camera_processor.SerialManager = DummySerialManager
+        def _dummy_factory():
+            return DummySerialManager(logger_instance=logger)
+
+        camera_processor.SerialManager = _dummy_factory
     else:
-        if args.forward_serial_stdio is not None:
+        if args.forward_serial_stdio:
             logger.info("Setting FORWARD_SERIAL_STDIO to %s", args.forward_serial_stdio)
         if args.baud is not None:
             logger.info("Setting SERIAL_BAUD to %s", args.baud)
         if args.serial_port is not None:
             logger.info("Setting SERIAL_PORT to %s", args.serial_port)
         
-        # Create a factory that returns a SerialManager configured with the CLI args
+        # Create a factory that returns a SerialManager configured with the CLI args;
+        # options not given on the command line keep the SerialManager defaults
+        serial_kwargs = {}
+        if args.serial_port is not None:
+            serial_kwargs['port'] = args.serial_port
+        if args.baud is not None:
+            serial_kwargs['baud'] = args.baud
+
         def _factory():
-            return SM.SerialManager(port=args.serial_port, baud=args.baud, forward_serial_stdio=args.forward_serial_stdio, logger_instance=logger)
+            return SM.SerialManager(forward_serial_stdio=args.forward_serial_stdio, logger_instance=logger, **serial_kwargs)
 
         camera_processor.SerialManager = _factory
 
     # Validate model path before creating the detector
-    validate_model_path(camera_processor.MODEL_PATH)
+    validate_model_path(camera_processor.MODEL_PATH, logger)
 
     # Run the existing main loop
     camera_processor.main()
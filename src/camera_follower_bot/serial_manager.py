@@ -1,6 +1,9 @@
+import random
 import serial
+import sys
 import time
 from collections import deque
+from itertools import islice
 import logging
 from rpi_pico_code.remote_logger import CustomFormatter
 
@@ -13,8 +16,18 @@ logger = None
 SERIAL_PORT = '/dev/cu.usbmodem101'
 SERIAL_BAUD = 115200
 DEFAULT_STDOUT_BUFFER_SIZE = 100  # Number of lines to keep in stdout buffer
+TX_FLUSH_BYTES = 64  # Flush buffered position writes once this many bytes are pending
+TX_FLUSH_INTERVAL_NS = 20_000_000  # ... or once this long (20 ms) has passed since the last flush
+RX_READ_LIMIT = 4096  # Max bytes taken from the port per read_stdout() call
 
+BACKOFF_JITTER_DIVISOR = 4  # Up to 1/4 of each reconnect backoff is randomly cut off
+SERIAL_RESET_DELAY_S = 2.0  # Time the device needs to reset after the port is opened
 SERVO_RELAX_TIMEOUT_SECONDS = 2.0  # Timeout for servo relax acknowledgment
+RELAX_COMMAND = b'RELAX\n'  # Line that makes the device relax its servos
+RELAX_ACK = b'ACK_RELAX'  # Log message the device prints once the servos are relaxed
+# Complete line (without line ending) the remote logger prints for RELAX_ACK
+RELAX_ACK_LINE = CustomFormatter.LEVEL_PREFIX[logging.INFO].encode() + b' ' + RELAX_ACK
+RELAX_READ_LIMIT = 256  # Max bytes taken per blocking read while waiting for the RELAX_ACK line
 
 class SerialManager:
     """Manage a serial connection with non-blocking exponential backoff reconnects.
@@ -23,16 +36,31 @@ class SerialManager:
     iteration and use `send_position(error_x,error_y)` to send payloads.
     The manager will silently drop sends when disconnected and attempt
     reconnects in the background (timed checks), avoiding blocking the
-    main camera loop.
+    main camera loop. After opening the port the device resets; for
+    `reset_delay` seconds the manager reports itself as not connected and
+    drops sends instead of sleeping. Position payloads are coalesced into one `write()`
+    per TX_FLUSH_INTERVAL_NS (or TX_FLUSH_BYTES) to save syscalls and USB frames;
+    call `flush_if_due()` every loop iteration so a buffered payload is not held
+    back when no further send follows.
     
     Stdout tunneling: call `read_stdout()` to read available output from the
     device. The output is buffered internally and can be retrieved via
     `get_stdout_buffer()`.
     """
 
+    # Fixed attribute set: no per-instance __dict__, faster attribute access
+    __slots__ = (
+        'port', 'baud', 'timeout', 'ser', 'reset_delay', '_ready_at',
+        'min_backoff', 'max_backoff', 'attempt_count', 'next_attempt_time', 'last_error',
+        'stdout_buffer_size', 'stdout_buffer', '_partial_line', 'forward_serial_stdio',
+        '_tx_buf', '_last_flush_ns',
+    )
+
     def __init__(self, port: str = SERIAL_PORT, baud: int = SERIAL_BAUD, timeout: float = 1.0,
                  min_backoff: float = 0.5, max_backoff: float = 30.0,
                  stdout_buffer_size: int = DEFAULT_STDOUT_BUFFER_SIZE,
+                 forward_serial_stdio: bool = False,
+                 reset_delay: float = None,
                  logger_instance=None):
         global logger
         logger = logger_instance
@@ -40,6 +68,10 @@ class SerialManager:
         self.baud = baud
         self.timeout = timeout
         self.ser = None
+        # None: use SERIAL_RESET_DELAY_S
+        self.reset_delay = SERIAL_RESET_DELAY_S if reset_delay is None else reset_delay
+        # monotonic time at which the freshly opened port becomes usable (0.0: ready)
+        self._ready_at = 0.0
         # backoff parameters
         self.min_backoff = min_backoff
         self.max_backoff = max_backoff
@@ -50,15 +82,21 @@ class SerialManager:
         # stdout buffering
         self.stdout_buffer_size = stdout_buffer_size
         self.stdout_buffer = deque(maxlen=stdout_buffer_size)
-        self._partial_line = ""
+        self._partial_line = bytearray()
+        # echo every complete device line to the host's stdout
+        self.forward_serial_stdio = forward_serial_stdio
 
+        # transmit buffering for position payloads
+        self._tx_buf = bytearray()
+        self._last_flush_ns = 0
 
     def connect(self):
         """Try to open the serial port once. Returns True if successful."""
         try:
             self.ser = serial.Serial(self.port, self.baud, timeout=self.timeout)
-            # allow the device to reset
-            time.sleep(2)
+            # allow the device to reset without blocking the caller: the port
+            # counts as not connected until the delay has passed
+            self._ready_at = time.monotonic() + self.reset_delay if self.reset_delay > 0 else 0.0
             self.attempt_count = 0
             self.next_attempt_time = 0.0
             self.last_error = None
@@ -66,131 +104,246 @@ class SerialManager:
         except Exception as exc:
             # schedule next attempt using exponential backoff
             self.ser = None
-            self.last_error = exc
-            self.attempt_count += 1
-            backoff = min(self.min_backoff * (2 ** (self.attempt_count - 1)), self.max_backoff)
-            self.next_attempt_time = time.time() + backoff
+            self._schedule_reconnect(exc)
             return False
 
-    def reconnect_if_needed(self):
-        """If disconnected and backoff time passed, attempt reconnect."""
-        if self.ser is None and time.time() >= self.next_attempt_time:
-            self.connect()
+    def _schedule_reconnect(self, exc):
+        """Record a failure and schedule the next connect attempt using exponential backoff.
+
+        Times are on the time.monotonic() clock, so wall clock (NTP) steps
+        cannot fire reconnects early or postpone them indefinitely. A random
+        jitter of up to 1/BACKOFF_JITTER_DIVISOR of the backoff keeps several
+        managers that lost the device together from retrying in lockstep.
+        """
+        self.last_error = exc
+        self.attempt_count += 1
+        # Cap the exponent: backoff saturates at max_backoff long before, and
+        # huge powers of two would overflow the float multiplication
+        exponent = min(self.attempt_count - 1, 32)
+        backoff = min(self.min_backoff * (1 << exponent), self.max_backoff)
+        backoff -= random.random() * backoff / BACKOFF_JITTER_DIVISOR
+        self.next_attempt_time = time.monotonic() + backoff
+
+    def _drop_connection(self, exc):
+        """Close a failed port, discard pending output and schedule a reconnect."""
+        try:
+            self.ser.close()
+        except Exception:
+            pass
+        self.ser = None
+        self._tx_buf.clear()
+        self._schedule_reconnect(exc)
+
+    def reconnect_if_needed(self, now=None):
+        """If disconnected and backoff time passed, attempt reconnect.
+
+        `now` may be passed in as a time.monotonic() timestamp the caller
+        already took this iteration; the clock is only read when needed.
+        """
+        if self.ser is None:
+            if now is None:
+                now = time.monotonic()
+            if now >= self.next_attempt_time:
+                self.connect()
 
     def is_connected(self) -> bool:
-        return self.ser is not None and getattr(self.ser, 'is_open', True)
+        ser = self.ser
+        if ser is None or not ser.is_open:
+            return False
+        return not self._ready_at or self._is_ready()
+
+    def _is_ready(self) -> bool:
+        """Return True once the post-open reset delay has passed."""
+        if time.monotonic() < self._ready_at:
+            return False
+        # the clock is no longer consulted after the device became ready
+        self._ready_at = 0.0
+        return True
 
     def write(self, data: bytes):
         """Write bytes to serial port if connected. On failure, close and schedule reconnect."""
         if not data:
             return False
-        if not self.is_connected():
+        ser = self.ser
+        if ser is None or not ser.is_open:
             return False
-        if self.ser is None:
+        if self._ready_at and not self._is_ready():
+            # device still resetting: drop the payload
             return False
         try:
-            self.ser.write(data)
-            if logger:
+            ser.write(data)
+            if logger and logger.isEnabledFor(logging.DEBUG):
                 logger.debug(f"Serial write: {data.decode().strip()}")
             return True
         except Exception as exc:
             # mark disconnected and schedule reconnect
-            try:
-                self.ser.close()
-            except Exception:
-                pass
-            self.ser = None
-            self.last_error = exc
-            self.attempt_count += 1
-            backoff = min(self.min_backoff * (2 ** (self.attempt_count - 1)), self.max_backoff)
-            self.next_attempt_time = time.time() + backoff
+            self._drop_connection(exc)
             return False
 
 
     
     @staticmethod
     def encode_line(error_x, error_y):
-        """Format positional data as bytes."""
+        """Format positional data as bytes.
+
+        Returns None if a value cannot be converted to int.
+        """
         try:
-            return f"{int(error_x)},{int(error_y)}\n"
-        except Exception:
+            # The tracker already passes ints; only convert other types
+            if type(error_x) is not int:
+                error_x = int(error_x)
+            if type(error_y) is not int:
+                error_y = int(error_y)
+        except (TypeError, ValueError, OverflowError):
             return None
+        # bytes %-formatting skips building a str and encoding it
+        return b"%d,%d\n" % (error_x, error_y)
 
     def send_position(self, error_x, error_y):
-        """Format and send positional data if connected; otherwise do nothing."""
+        """Format and queue positional data if connected; otherwise do nothing.
+
+        Payloads are buffered and written together once TX_FLUSH_BYTES are
+        pending or TX_FLUSH_INTERVAL_NS has passed since the last flush.
+        Returns False if the data is invalid, the port is disconnected or
+        the flush failed.
+        """
+        # Check the port first so nothing is formatted while disconnected
+        if not self.is_connected():
+            return False
         data = SerialManager.encode_line(error_x, error_y)
         if data is None:
             return False
-        return self.write(data.encode('utf-8'))
+        self._tx_buf += data
+        now_ns = time.monotonic_ns()
+        if len(self._tx_buf) >= TX_FLUSH_BYTES or now_ns - self._last_flush_ns >= TX_FLUSH_INTERVAL_NS:
+            return self._flush_tx(now_ns)
+        return True
+
+    def _flush_tx(self, now_ns: int):
+        """Write all buffered position payloads in a single call."""
+        data = bytes(self._tx_buf)
+        self._tx_buf.clear()
+        self._last_flush_ns = now_ns
+        return self.write(data)
+
+    def flush_if_due(self, now_ns: int = None):
+        """Write buffered position payloads once TX_FLUSH_INTERVAL_NS has passed
+        since the last flush, without waiting for another send_position().
+
+        `now_ns` may be passed in as a time.monotonic_ns() timestamp the caller
+        already took. Returns True if nothing was due or the write succeeded.
+        """
+        if not self._tx_buf:
+            return True
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        if now_ns - self._last_flush_ns < TX_FLUSH_INTERVAL_NS:
+            return True
+        return self._flush_tx(now_ns)
+
+    def flush(self):
+        """Write any buffered position payloads now.
+
+        Returns True if nothing was pending or the write succeeded.
+        """
+        if not self._tx_buf:
+            return True
+        return self._flush_tx(time.monotonic_ns())
     
     def read_stdout(self):
         """Read available stdout from the serial device and buffer it.
         Treat lines with known remote_logger prefixes as log output and forward to logger.
+        Without any consumer (stdout_buffer_size 0, no forwarding, no logger)
+        pending bytes are discarded via drain_input().
         Returns True if data was read successfully, False otherwise.
         """
-        if not self.is_connected():
-            return False
-        if self.ser is None:
+        ser = self.ser
+        if ser is None or not ser.is_open:
             return False
+        if self.stdout_buffer_size == 0 and not self.forward_serial_stdio and logger is None:
+            # Nobody consumes the output: drop it instead of splitting and decoding lines
+            return self.drain_input()
 
         try:
-            # Read all available bytes without blocking
-            if self.ser.in_waiting > 0:
-                data = self.ser.read(self.ser.in_waiting)
-                decoded = data.decode('utf-8', errors='replace')
-
-                # Combine with any partial line from previous read
-                decoded = self._partial_line + decoded
-
-                # Split into lines
-                lines = decoded.split('\n')
-
-                # Last element might be incomplete line
-                self._partial_line = lines[-1]
-
-                # Add complete lines to buffer
-                for line in lines[:-1]:
-                    line_stripped = line.rstrip('\r')
-                    if line_stripped.strip():
-                        self.stdout_buffer.append(line_stripped)
-
-                        # Check for remote_logger prefix and forward to own logger
-                        for prefix in CustomFormatter.LEVEL_PREFIX.values():
-                            if line_stripped.startswith(prefix):
-                                if logger:
-                                    # Remove prefix and whitespace
-                                    msg = line_stripped[len(prefix):].strip()
-                                    if prefix == CustomFormatter.LEVEL_PREFIX.get(logging.DEBUG):
-                                        logger.debug(f"Remote log: {msg}")
-                                    elif prefix == CustomFormatter.LEVEL_PREFIX.get(logging.INFO):
-                                        logger.info(f"Remote log: {msg}")
-                                    elif prefix == CustomFormatter.LEVEL_PREFIX.get(logging.WARNING):
-                                        logger.warning(f"Remote log: {msg}")
-                                    elif prefix == CustomFormatter.LEVEL_PREFIX.get(logging.ERROR):
-                                        logger.error(f"Remote log: {msg}")
-                                    elif prefix == CustomFormatter.LEVEL_PREFIX.get(logging.CRITICAL):
-                                        logger.critical(f"Remote log: {msg}")
-                                    else: # default case
-                                        logger.info(f"Remote log: {msg}")
-                                break
-                        else:
-                            # No known prefix, fallback to info
-                            if logger:
-                                logger.info(f"Serial read: {line_stripped}")
-
+            # Read the available bytes in one call without blocking; nothing
+            # is allocated when no data arrived. Anything beyond RX_READ_LIMIT
+            # stays queued for the next call.
+            waiting = ser.in_waiting
+            if waiting > 0:
+                self._consume_output(ser.read(min(waiting, RX_READ_LIMIT)))
                 return True
             return False
         except Exception as exc:
             # On read error, mark disconnected and schedule reconnect
-            try:
-                self.ser.close()
-            except Exception:
-                pass
-            self.ser = None
-            self.last_error = exc
-            self.attempt_count += 1
-            backoff = min(self.min_backoff * (2 ** (self.attempt_count - 1)), self.max_backoff)
-            self.next_attempt_time = time.time() + backoff
+            self._drop_connection(exc)
+            return False
+
+    def _consume_output(self, data: bytes):
+        """Append received bytes to the line accumulator and process every
+        completed line (buffer, optional forwarding, remote log routing).
+        """
+        # Bytes are collected until a line is complete and only complete
+        # lines are decoded; the device only prints ASCII
+        partial = self._partial_line
+        partial += data
+        # completed lines are handed to the stdout buffer in one extend()
+        lines = []
+        start = 0
+        end = partial.find(b'\n')
+        while end >= 0:
+            line_stripped = partial[start:end].rstrip(b'\r').decode('ascii', errors='replace')
+            start = end + 1
+            end = partial.find(b'\n', start)
+            if line_stripped.strip():
+                lines.append(line_stripped)
+                if self.forward_serial_stdio:
+                    sys.stdout.write(f"Read: {line_stripped}\n")
+
+                # Check for remote_logger prefix and forward to own logger
+                for prefix in CustomFormatter.LEVEL_PREFIX.values():
+                    if line_stripped.startswith(prefix):
+                        if logger:
+                            # Remove prefix and whitespace
+                            msg = line_stripped[len(prefix):].strip()
+                            if prefix == CustomFormatter.LEVEL_PREFIX.get(logging.DEBUG):
+                                logger.debug(f"Remote log: {msg}")
+                            elif prefix == CustomFormatter.LEVEL_PREFIX.get(logging.INFO):
+                                logger.info(f"Remote log: {msg}")
+                            elif prefix == CustomFormatter.LEVEL_PREFIX.get(logging.WARNING):
+                                logger.warning(f"Remote log: {msg}")
+                            elif prefix == CustomFormatter.LEVEL_PREFIX.get(logging.ERROR):
+                                logger.error(f"Remote log: {msg}")
+                            elif prefix == CustomFormatter.LEVEL_PREFIX.get(logging.CRITICAL):
+                                logger.critical(f"Remote log: {msg}")
+                            else: # default case
+                                logger.info(f"Remote log: {msg}")
+                        break
+                else:
+                    # No known prefix, fallback to info
+                    if logger:
+                        logger.info(f"Serial read: {line_stripped}")
+
+        if lines:
+            self.stdout_buffer.extend(lines)
+        # Keep the incomplete tail for the next read
+        del partial[:start]
+
+    def drain_input(self):
+        """Discard pending device output without reading or decoding it.
+
+        Returns True if pending bytes were dropped, False otherwise.
+        """
+        ser = self.ser
+        if ser is None or not ser.is_open:
+            return False
+        try:
+            if ser.in_waiting > 0:
+                ser.reset_input_buffer()
+                self._partial_line.clear()
+                return True
+            return False
+        except Exception as exc:
+            self._drop_connection(exc)
             return False
     
     def get_stdout_buffer(self, max_lines=None):
@@ -202,19 +355,26 @@ class SerialManager:
         Returns:
             List of stdout lines (strings), most recent last.
         """
+        buffer = self.stdout_buffer
         if max_lines is None:
-            return list(self.stdout_buffer)
-        else:
-            # Return the most recent max_lines
-            return list(self.stdout_buffer)[-max_lines:]
+            return list(buffer)
+        skip = len(buffer) - max_lines
+        if 0 < max_lines and skip > 0:
+            # Return the most recent max_lines without copying the whole buffer first
+            return list(islice(buffer, skip, None))
+        return list(buffer)[-max_lines:]
     
     def clear_stdout_buffer(self):
         """Clear the stdout buffer."""
         self.stdout_buffer.clear()
-        self._partial_line = ""
+        self._partial_line.clear()
     
     def send_relax_command(self, timeout: float = SERVO_RELAX_TIMEOUT_SECONDS):
         """Send RELAX command to microcontroller and wait for acknowledgment.
+
+        The device leaves its main loop, relaxes the servos and only then
+        prints the RELAX_ACK_LINE, so a True result means the servos are
+        relaxed, not merely that the command arrived.
         
         Args:
             timeout: Maximum time to wait for acknowledgment in seconds.
@@ -224,30 +384,48 @@ class SerialManager:
         """
         if not self.is_connected():
             return False
-        
-        # Clear buffer before sending to avoid false positives from old data
-        initial_buffer_len = len(self.stdout_buffer)
-        
+
         # Send RELAX command
-        if not self.write(b'RELAX\n'):
+        if not self.write(RELAX_COMMAND):
             return False
-        
-        # Wait for acknowledgment
-        start_time = time.time()
-        while (time.time() - start_time) < timeout:
-            # Read available data
-            if self.read_stdout():
-                # Check only new lines added since we started
-                stdout_lines = self.get_stdout_buffer()
-                for line in stdout_lines[initial_buffer_len:]:
-                    if line.strip() == 'ACK_RELAX':
+
+        # Wait for acknowledgment by blocking in the serial read itself, one
+        # line at a time; only bytes received after the command are inspected.
+        # Everything read on the way (including the acknowledgment line) goes
+        # through the normal line accumulator.
+        ser = self.ser
+        deadline = time.monotonic() + timeout
+        prior_timeout = ser.timeout
+        # the acknowledgment is a whole line: a line already partly received
+        # before the command cannot be it
+        line_start = not self._partial_line
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                ser.timeout = remaining
+                data = ser.read_until(b'\n', RELAX_READ_LIMIT)
+                self._consume_output(data)
+                if data.endswith(b'\n'):
+                    if line_start and data.rstrip(b'\r\n') == RELAX_ACK_LINE:
                         if logger:
-                            logger.info(f"Servo relaxation confirmed: {line}")
+                            logger.info("Servo relaxation confirmed")
                         return True
-            
-            # Small sleep to avoid busy-waiting
-            time.sleep(0.01)
-        
+                    line_start = True
+                elif len(data) < RELAX_READ_LIMIT:
+                    # read timed out
+                    break
+                else:
+                    # a line longer than one read is not the acknowledgment
+                    line_start = False
+        except Exception as exc:
+            self._drop_connection(exc)
+            return False
+        finally:
+            if self.ser is ser:
+                ser.timeout = prior_timeout
+
         # Timeout reached without acknowledgment
         if logger:
             logger.warning("Servo relaxation acknowledgment not received within timeout")
@@ -256,12 +434,17 @@ class SerialManager:
     def close(self):
         """Close the serial connection gracefully.
         
-        Attempts to send RELAX command before closing.
+        Attempts to send RELAX command before closing (unless the device is
+        still resetting, in which case the servos are not driven yet).
         """
-        if self.is_connected() and self.ser is not None:
-            # Try to relax servos before closing
-            self.send_relax_command(timeout=1.0)
-            
+        if self.ser is not None:
+            if self.is_connected():
+                # Deliver pending positions first so they cannot follow the RELAX command
+                self.flush()
+
+                # Try to relax servos before closing
+                self.send_relax_command(timeout=1.0)
+
             # Close the connection
             try:
                 self.ser.close()
@@ -1,8 +1,15 @@
 import time
-import random
+import array
+import logging
+
+from mp_compat import micropython, const, ptr32, uint
+
+# 1: compile in the per-cycle debug logging (servo steps, received errors);
+# with 0 the MicroPython compiler drops these branches entirely
+LOG_DEBUG = const(0)
 
 from remote_logger import get_remote_logger
-logger = get_remote_logger(__name__)
+logger = get_remote_logger(__name__, level=logging.DEBUG if LOG_DEBUG else logging.INFO)
 
     
 from input_reader import InputReader
@@ -12,38 +19,110 @@ from machine import Pin, PWM
 DEADZONE_EYE = 25 # Beyond this threshold of target movement from center position, eye servos will move
 DEADZONE_NECK = 20 # Beyond this threshold of eye movement from center position, a neck movement is triggered
 NECK_DELAY_MS = 1200 # Minimum wait time between two neck moves (ms)
-NECK_EYES_HOR_TRANSLATION = 1.25
-NECK_EYES_VER_TRANSLATION = 0.6
-KP = 0.03
+# Eye-to-neck translation factors as integer fractions (1.25 and 0.6)
+NECK_EYES_HOR_NUM = 5
+NECK_EYES_HOR_DEN = 4
+NECK_EYES_VER_NUM = 3
+NECK_EYES_VER_DEN = 5
+# Proportional gain of the eye servos as an integer fraction (0.03): the
+# RP2040 has no FPU, so the control step is computed in integer math
+KP_NUM = 3
+KP_DEN = 100
 
-CYCLE_TIME_S = 0.1  # Main loop min cycle time (s)
+CYCLE_TIME_MS = 100  # Main loop min cycle time (ms)
+MAX_CYCLE_LAG_MS = 2 * CYCLE_TIME_MS  # Behind schedule by more than this, the cycle schedule restarts (ms)
 
-MIN_BLINK_WAIT_MS = 1000 # Minimum wait time between two blinks (ms)
-MAX_BLINK_WAIT_MS = 5000 # Maximum wait time between two blinks (ms)
-BLINK_TIME_S = 0.2  # Time eyelids stay closed during blink (s)
+MIN_BLINK_WAIT_MS = const(1000) # Minimum wait time between two blinks (ms)
+MAX_BLINK_WAIT_MS = const(5000) # Maximum wait time between two blinks (ms)
+BLINK_WAIT_SPAN_MS = const(MAX_BLINK_WAIT_MS - MIN_BLINK_WAIT_MS) # Random part of the blink wait (ms)
+BLINK_TIME_MS = 200  # Time eyelids stay closed during blink (ms)
 
-DISABLE_SLEEP_S = 0.5  # Sleep time when disabled
-SWEEP_DELAY_S = 1.0  # Delay between servo sweeps (s)
+DISABLE_SLEEP_MS = 500  # Sleep time when disabled (ms)
+SWEEP_DELAY_MS = 1000  # Delay between servo sweeps (ms)
+SWEEP_POLL_MS = 10  # Interval in which a running sweep checks whether it should stop (ms)
 
 
 LID_SYNC_OFFSET = -30  # Offset to keep eyelids slightly more closed than eye vertical position
 NECK_SPEED_DEG_PER_S=60 # Speed of neck movement in degrees per second
 
 SERVO_FREQUENCY_HZ = 50  # Standard servo frequency
-SERVO_MIN_US = 544.0
-SERVO_MAX_US = 2400.0
-SERVO_RANGE_DEG = 180.0
+SERVO_MIN_US = 544
+SERVO_MAX_US = 2400
+SERVO_RANGE_DEG = const(180)
+# Pulse width in integer nanoseconds: SERVO_MIN_NS + angle * SERVO_SPAN_NS // SERVO_RANGE_DEG
+# (compile-time constants so the viper code below inlines them)
+SERVO_MIN_NS = const(544000)  # SERVO_MIN_US * 1000
+SERVO_SPAN_NS = const(1856000)  # (SERVO_MAX_US - SERVO_MIN_US) * 1000
 
 
 
-# Compatibility for time.monotonic() in MicroPython
+# Compatibility for time.monotonic() in MicroPython: integer milliseconds,
+# compared with ticks_diff() since ticks_ms() wraps around
 try:
     # MicroPython
     monotonic_ms = time.ticks_ms
+    ticks_diff = time.ticks_diff
+    ticks_add = time.ticks_add
+    sleep_ms = time.sleep_ms
 except AttributeError:
     # CPython
     import time as _time
     monotonic_ms = lambda: int(_time.monotonic() * 1000)
+    ticks_diff = lambda new, old: new - old
+    ticks_add = lambda ticks, delta: ticks + delta
+    sleep_ms = lambda ms: _time.sleep(ms / 1000)
+
+
+@micropython.viper
+def _angle_to_ns(angle: int) -> int:
+    """Servo pulse width in ns for an angle in degrees (machine-word integer math)."""
+    return SERVO_MIN_NS + angle * SERVO_SPAN_NS // SERVO_RANGE_DEG
+
+
+@micropython.viper
+def _step_towards(current: int, target: int, step: int) -> int:
+    """Move current towards target by at most step."""
+    delta = target - current
+    if delta > step:
+        delta = step
+    elif delta < 0 - step:
+        delta = 0 - step
+    return current + delta
+
+
+# State of the blink wait generator (32-bit LCG); blinks only need to look
+# irregular, not be statistically random
+_blink_rng_state = array.array('I', (0x12345678,))
+
+
+@micropython.viper
+def _next_blink_wait_ms() -> int:
+    """Wait until the next blink: MIN_BLINK_WAIT_MS..MAX_BLINK_WAIT_MS (ms)."""
+    state = ptr32(_blink_rng_state)
+    # native 32-bit wraparound, no long-int allocation
+    x = uint(uint(state[0]) * uint(1103515245) + uint(12345))
+    state[0] = x
+    # the high bits of an LCG are the most random ones
+    return MIN_BLINK_WAIT_MS + int(x >> 16) % (BLINK_WAIT_SPAN_MS + 1)
+
+
+# Pulse width per whole degree 0..SERVO_RANGE_DEG, so write() only does an indexed load
+_DUTY_NS_TABLE = array.array('I', [_angle_to_ns(a) for a in range(SERVO_RANGE_DEG + 1)])
+
+
+# Switch inputs (pulled up, so a closed switch reads 0) and status LED
+ENABLE_PIN = const(6)
+MODE_PIN = const(7)
+BLINK_PIN = const(9)
+LED_PIN = const(25)
+# RP2040 SIO GPIO_IN register: the input level of every GPIO, bit n = GPIO n
+SIO_GPIO_IN = const(0xd0000004)
+
+
+@micropython.viper
+def _read_gpio_in() -> int:
+    """Levels of all GPIO inputs from a single register load."""
+    return int(ptr32(SIO_GPIO_IN)[0])
 
 
 # Simple replacement for Mode Enum
@@ -57,10 +136,10 @@ class Hardware:
 
     def __init__(self):
         # switches
-        self.enable = Pin(6, Pin.IN, Pin.PULL_UP)
-        self.mode = Pin(7, Pin.IN, Pin.PULL_UP)
-        self.blink_pin = Pin(9, Pin.IN, Pin.PULL_UP)
-        self.led = Pin(25, Pin.OUT)
+        self.enable = Pin(ENABLE_PIN, Pin.IN, Pin.PULL_UP)
+        self.mode = Pin(MODE_PIN, Pin.IN, Pin.PULL_UP)
+        self.blink_pin = Pin(BLINK_PIN, Pin.IN, Pin.PULL_UP)
+        self.led = Pin(LED_PIN, Pin.OUT)
 
     def get_mode(self):
         # Return Mode.HOLD if self.mode.value() == False, else Mode.AUTO
@@ -69,24 +148,41 @@ class Hardware:
     def is_enabled(self):
         return self.enable.value()
 
-    def led_flash(self, times=4, interval=0.2):
-        logger.debug(f"LED flash {times} times with interval {interval}s")
+    @staticmethod
+    def read_inputs():
+        """Read all switch levels at once (bit n = GPIO n).
+
+        Test with the *_PIN constants instead of calling get_mode() and
+        is_enabled(), which read one pin each.
+        """
+        return _read_gpio_in()
+
+    def led_flash(self, times=4, interval_ms=200):
+        logger.debug(f"LED flash {times} times with interval {interval_ms}ms")
         for _ in range(times):
             self.led.value(True)
-            time.sleep(interval)
+            sleep_ms(interval_ms)
             self.led.value(False)
-            time.sleep(interval)
+            sleep_ms(interval_ms)
 
     def led_trigger(self):
         self.led.value(not self.led.value())
 
 # Servo configuration class
 class ServoConfig:
+    # Fixed attribute set (saves the per-instance dict where __slots__ is supported)
+    __slots__ = ('min', 'max', 'default', 'target', '_lo', '_hi', '_written', 'pin', 'pwm')
+
     def __init__(self, pin, min_pos, max_pos, default):
         self.min = min_pos
         self.max = max_pos
         self.default = default
         self.target = default
+        # write() limits, ordered once (min may be above max for mirrored servos)
+        self._lo = min(min_pos, max_pos)
+        self._hi = max(min_pos, max_pos)
+        # angle of the last PWM write (None until the first write or after relax)
+        self._written = None
         self.pin = Pin(pin)
         
         self.pwm = PWM(self.pin)
@@ -95,22 +191,25 @@ class ServoConfig:
 
     def write(self, angle):
         """Write angle to servo, respecting min/max limits."""
-        # ensure lo <= hi
-        lo = self.min
-        hi = self.max
-        if lo > hi:
-            lo, hi = hi, lo
-
         # Make sure angle is within bounds
-        angle = min(max(lo, angle), hi)
-    
+        if angle < self._lo:
+            angle = self._lo
+        elif angle > self._hi:
+            angle = self._hi
+
+        # Skip redundant PWM writes for an unchanged angle
+        if angle == self._written:
+            self.target = angle
+            return
+        self._written = angle
+
         #self.servo.write(angle)
-        
 
-        current_us = angle / SERVO_RANGE_DEG * (SERVO_MAX_US - SERVO_MIN_US) + SERVO_MIN_US
-        self.pwm.duty_ns(int(current_us * 1000.0))
+        # table lookup, no arithmetic (no FPU on the RP2040); servo limits
+        # lie within 0..SERVO_RANGE_DEG
+        self.pwm.duty_ns(_DUTY_NS_TABLE[angle])
 
-        #logger.debug(f"Servo on pin {self.pin} set to angle {angle} (limits: {lo}-{hi}) = {current_us}us pulse")
+        #logger.debug(f"Servo on pin {self.pin} set to angle {angle} (limits: {self._lo}-{self._hi}) = {pulse_ns}ns pulse")
 
         self.target = angle
 
@@ -122,27 +221,31 @@ class ServoConfig:
     def relax(self):
         """Deactivate servo PWM signal."""
         self.pwm.deinit()
+        # the next write() has to drive the PWM again
+        self._written = None
         logger.debug(f"Servo on pin {self.pin} relaxed")
 
-    def move_to_target(self, error, kp, deadzone):
+    @micropython.native
+    def move_to_target(self, error, kp_num, kp_den, deadzone):
         """Move a given servo target based on error and proportional control.
 
-        Returns True if a movement occurred.
+        The gain is kp_num / kp_den; the step is truncated towards zero
+        using integer math only. Returns True if a movement occurred.
         """
-        if abs(error) <= deadzone:
-            return False
-
         # adjust error relative to deadzone
-        if error > 0:
-            adj = error - deadzone
+        if error > deadzone:
+            step = (error - deadzone) * kp_num // kp_den
+            if step == 0:
+                step = 1
+        elif error < -deadzone:
+            step = -((-error - deadzone) * kp_num // kp_den)
+            if step == 0:
+                step = -1
         else:
-            adj = error + deadzone
-
-        step = int(kp * adj)
-        if step == 0:
-            step = 1 if adj > 0 else -1
+            return False
 
-        logger.debug(f"Moving servo on pin {self.pin} by step {step} for error {error} (adj: {adj})")
+        if LOG_DEBUG:
+            logger.debug("Moving servo on pin %s by step %d for error %d", self.pin, step, error)
         
         new_target = self.target + step
         self.write(new_target)
@@ -153,10 +256,19 @@ class ServoConfig:
 class ServoController:
     """Manages servo targets, limits and movements."""
 
+    __slots__ = (
+        'last_update', 'neck_hor_target', 'neck_ver_target', '_lid_synced_ver',
+        'servo_eyes_hor', 'servo_eyes_ver', 'servo_left_lid', 'servo_right_lid',
+        'servo_neck_hor', 'servo_neck_ver', '_all_servos',
+        '_lid_sync_span', '_left_lid_base', '_left_lid_slope', '_right_lid_base', '_right_lid_slope',
+    )
 
     def __init__(self):
         self.last_update = monotonic_ms()
 
+        # servo_eyes_ver.target the lids were last synced to (None: resync)
+        self._lid_synced_ver = None
+
         # helper values for smooth neck movement
         self.neck_hor_target = 90
         self.neck_ver_target = 90
@@ -168,50 +280,73 @@ class ServoController:
         self.servo_right_lid = ServoConfig(pin=14, min_pos=90, max_pos=10, default=90)
         self.servo_neck_hor = ServoConfig(pin=13, min_pos=10, max_pos=170, default=90)
         self.servo_neck_ver = ServoConfig(pin=15, min_pos=40, max_pos=140, default=90)
+        # all servos for the operations applied to each of them
+        self._all_servos = (
+            self.servo_eyes_hor, self.servo_eyes_ver,
+            self.servo_left_lid, self.servo_right_lid,
+            self.servo_neck_hor, self.servo_neck_ver,
+        )
+
+        # lid_sync() coefficients; servo limits are fixed, so compute them once
+        self._lid_sync_span = 2 * (self.servo_eyes_ver.max - self.servo_eyes_ver.min)
+        self._left_lid_base = self.servo_left_lid.max - LID_SYNC_OFFSET
+        # signed lid travel per unit of eye movement: the left lid closes
+        # towards min as the eyes look up (hence the sign flip), the right
+        # lid is mounted mirrored (min_pos > max_pos), so its slope is
+        # negative as configured
+        self._left_lid_slope = -(self.servo_left_lid.max - self.servo_left_lid.min)
+        self._right_lid_base = self.servo_right_lid.min + LID_SYNC_OFFSET
+        self._right_lid_slope = self.servo_right_lid.max - self.servo_right_lid.min
 
     def calibrate(self):
         """Calibrate all servos to default position (e.g. in hold mode)."""
         logger.info("Calibrate all servos")
-        self.servo_eyes_hor.calibrate()
-        self.servo_eyes_ver.calibrate()
-        self.servo_left_lid.calibrate()
-        self.servo_right_lid.calibrate()
-        self.servo_neck_hor.calibrate()
-        self.servo_neck_ver.calibrate()
+        for servo in self._all_servos:
+            servo.calibrate()
+        self._lid_synced_ver = None
 
     def relax(self):
         """Relax all servos to their default position."""
         logger.info("Relax all servos")
-        self.servo_eyes_hor.relax()
-        self.servo_eyes_ver.relax()
-        self.servo_left_lid.relax()
-        self.servo_right_lid.relax()
-        self.servo_neck_hor.relax()
-        self.servo_neck_ver.relax()
+        for servo in self._all_servos:
+            servo.relax()
+        self._lid_synced_ver = None
 
     def move_eyes(self, x_error, y_error):
         """Move eye servos based on x and y error values."""
-        logger.info(f"Move eyes: x-error: {-x_error} / y-error: {y_error}")
-        self.servo_eyes_hor.move_to_target(-x_error, KP, DEADZONE_EYE)
-        self.servo_eyes_ver.move_to_target(y_error, KP, DEADZONE_EYE)
+        if LOG_DEBUG:
+            logger.debug("Move eyes: x-error: %d / y-error: %d", -x_error, y_error)
+        self.servo_eyes_hor.move_to_target(-x_error, KP_NUM, KP_DEN, DEADZONE_EYE)
+        self.servo_eyes_ver.move_to_target(y_error, KP_NUM, KP_DEN, DEADZONE_EYE)
 
     def blink_eyes(self):
         """Perform a blink by moving eyelid servos to closed position"""
         logger.info("Blink eyes")
         self.servo_left_lid.write(self.servo_left_lid.min)
         self.servo_right_lid.write(self.servo_right_lid.min)
+        # the next lid_sync() has to reopen the lids
+        self._lid_synced_ver = None
 
+    @micropython.native
     def lid_sync(self):
         """Keep eyelid positions synced to vertical eye position."""
-        # normalize UD position to range 0..1 (Blickhöhe)
-        eyes_up_down_position_relative = (self.servo_eyes_ver.target - self.servo_eyes_ver.min) / (self.servo_eyes_ver.max - self.servo_eyes_ver.min)
+        # UD position relative to its range (Blickhöhe), kept as integers:
+        # relative = up / (span / 2), 1 - relative = down / (span / 2)
+        eyes_ver = self.servo_eyes_ver
+        target = eyes_ver.target
+        if target == self._lid_synced_ver:
+            # lids already match this eye position
+            return
+        self._lid_synced_ver = target
+        up = target - eyes_ver.min
+        span = self._lid_sync_span
+        down = (span >> 1) - up
 
-        # compute target positions for lids based on UD position
-        tl_target = int(self.servo_left_lid.max - ((self.servo_left_lid.max - self.servo_left_lid.min) * (0.5 * ( eyes_up_down_position_relative))) - LID_SYNC_OFFSET)
-        tr_target = int(self.servo_right_lid.min + ((self.servo_right_lid.max - self.servo_right_lid.min) * (0.5 * (1 - eyes_up_down_position_relative))) + LID_SYNC_OFFSET)
+        # compute target positions for lids based on UD position; floor
+        # division rounds like int() of the former float expression
+        tl_target = self._left_lid_base + (self._left_lid_slope * up) // span
+        tr_target = self._right_lid_base + (self._right_lid_slope * down) // span
 
-        #print(f"Lid sync targets: Left: {tl_target} ({self.servo_left_lid.min}-{self.servo_left_lid.max}), Right: {tr_target} ({self.servo_right_lid.min}-{self.servo_right_lid.max})"
-        #      f", Relative: {eyes_up_down_position_relative}")
         self.servo_left_lid.write(tl_target)
         self.servo_right_lid.write(tr_target)
 
@@ -220,85 +355,107 @@ class ServoController:
 
     def neck_target(self):
         """Map eye movement (LR/UD) to base targets (but do not yet move the base); tweak multipliers as needed."""
-        logger.info("Move neck")
-        self.neck_hor_target = int(self.servo_eyes_hor.target * NECK_EYES_HOR_TRANSLATION)
-        self.neck_ver_target = int(90 - ((90 - self.servo_eyes_ver.target) * NECK_EYES_VER_TRANSLATION))
-
-    def neck_smooth_move(self, speed_deg_per_s=NECK_SPEED_DEG_PER_S):
-        """Smoothly move neck servos towards target positions."""
-        now = monotonic_ms()
-        dt = now - self.last_update
-        self.last_update = now
+        if LOG_DEBUG:
+            logger.debug("Move neck")
+        # integer math, floored like int() of the positive float results
+        self.neck_hor_target = self.servo_eyes_hor.target * NECK_EYES_HOR_NUM // NECK_EYES_HOR_DEN
+        self.neck_ver_target = (
+            90 * NECK_EYES_VER_DEN - (90 - self.servo_eyes_ver.target) * NECK_EYES_VER_NUM
+        ) // NECK_EYES_VER_DEN
+
+    @micropython.native
+    def neck_smooth_move(self, now_ms=None, speed_deg_per_s=NECK_SPEED_DEG_PER_S):
+        """Smoothly move neck servos towards target positions.
+
+        now_ms is the monotonic_ms() timestamp of the current loop iteration.
+        """
+        if now_ms is None:
+            now_ms = monotonic_ms()
+        bx = self.servo_neck_hor.target
+        by = self.servo_neck_ver.target
+        if bx == self.neck_hor_target and by == self.neck_ver_target:
+            # neck at rest: nothing to write, restart the step timing from now
+            self.last_update = now_ms
+            return
+        dt = ticks_diff(now_ms, self.last_update)
         if dt <= 0:
             return
 
-        step_size = speed_deg_per_s * dt / 1000.0  # degrees to move this update
+        step_size = speed_deg_per_s * dt // 1000  # whole degrees to move this update
+        if step_size == 0:
+            # less than a degree due yet: keep last_update so the time adds up
+            return
+        self.last_update = now_ms
 
-        # BaseX
-        bx = float(self.servo_neck_hor.target)
-        bx_target = float(self.neck_hor_target)
-        dx = bx_target - bx
-        if abs(dx) <= step_size:
-            bx = bx_target
-        else:
-            bx += step_size if dx > 0 else -step_size
-        self.servo_neck_hor.write(int(round(bx)))
-
-        # BaseY
-        by = float(self.servo_neck_ver.target)
-        by_target = float(self.neck_ver_target)
-        dy = by_target - by
-        if abs(dy) <= step_size:
-            by = by_target
-        else:
-            by += step_size if dy > 0 else -step_size
-        self.servo_neck_ver.write(int(round(by)))
+        self.servo_neck_hor.write(_step_towards(bx, self.neck_hor_target, step_size))
+        self.servo_neck_ver.write(_step_towards(by, self.neck_ver_target, step_size))
+
+
+    @staticmethod
+    def _sweep_wait(keep_going):
+        """Wait SWEEP_DELAY_MS; return False early once keep_going() is False."""
+        deadline = ticks_add(monotonic_ms(), SWEEP_DELAY_MS)
+        while ticks_diff(deadline, monotonic_ms()) > 0:
+            if keep_going is not None and not keep_going():
+                return False
+            sleep_ms(SWEEP_POLL_MS)
+        return True
 
+    def _sweep_servo(self, servo, keep_going):
+        """Move one servo to min, max and back to default; False if aborted."""
+        servo.write(servo.min)
+        if not self._sweep_wait(keep_going):
+            return False
+        servo.write(servo.max)
+        if not self._sweep_wait(keep_going):
+            return False
+        servo.calibrate()
+        return True
 
-    def sweep(self):
+    def sweep(self, keep_going=None):
+        """Sweep all servos through their range one after another.
+
+        keep_going is polled every SWEEP_POLL_MS while waiting; once it
+        returns False the sweep stops immediately (e.g. on a mode change)
+        instead of blocking for the remaining sweep duration.
+        Returns True if the sweep completed.
+        """
         logger.info("Sweep all servos")
         self.calibrate()
 
         logger.info("Neck Horizontal Sweep Test")
-        self.servo_neck_hor.write(self.servo_neck_hor.min)
-        time.sleep(SWEEP_DELAY_S)
-        self.servo_neck_hor.write(self.servo_neck_hor.max)
-        time.sleep(SWEEP_DELAY_S)
-        self.servo_neck_hor.calibrate()
+        if not self._sweep_servo(self.servo_neck_hor, keep_going):
+            return False
 
         logger.info("Neck Vertical Sweep Test")
-        self.servo_neck_ver.write(self.servo_neck_ver.min)
-        time.sleep(SWEEP_DELAY_S)
-        self.servo_neck_ver.write(self.servo_neck_ver.max)
-        time.sleep(SWEEP_DELAY_S)
-        self.servo_neck_ver.calibrate()
+        if not self._sweep_servo(self.servo_neck_ver, keep_going):
+            return False
 
         logger.info("Left Lid Sweep Test")
-        self.servo_left_lid.write(self.servo_left_lid.min)
-        time.sleep(SWEEP_DELAY_S)
-        self.servo_left_lid.write(self.servo_left_lid.max)
-        time.sleep(SWEEP_DELAY_S)
-        self.servo_left_lid.calibrate()
+        if not self._sweep_servo(self.servo_left_lid, keep_going):
+            return False
 
         logger.info("Right Lid Sweep Test")
-        self.servo_right_lid.write(self.servo_right_lid.min)
-        time.sleep(SWEEP_DELAY_S)
-        self.servo_right_lid.write(self.servo_right_lid.max)
-        time.sleep(SWEEP_DELAY_S)
-        self.servo_right_lid.calibrate()
+        if not self._sweep_servo(self.servo_right_lid, keep_going):
+            return False
 
         logger.info("Eyes Sweep Test")
         self.servo_eyes_ver.write(self.servo_eyes_ver.min)
         self.servo_eyes_hor.write(self.servo_eyes_hor.min)
-        time.sleep(SWEEP_DELAY_S)
+        if not self._sweep_wait(keep_going):
+            return False
         self.servo_eyes_ver.write(self.servo_eyes_ver.max)
-        time.sleep(SWEEP_DELAY_S)
+        if not self._sweep_wait(keep_going):
+            return False
         self.servo_eyes_hor.write(self.servo_eyes_hor.max)
-        time.sleep(SWEEP_DELAY_S)
+        if not self._sweep_wait(keep_going):
+            return False
         self.servo_eyes_ver.write(self.servo_eyes_ver.min)
-        time.sleep(SWEEP_DELAY_S)
+        if not self._sweep_wait(keep_going):
+            return False
         self.servo_eyes_ver.calibrate()
         self.servo_eyes_hor.calibrate()
+        return True
 
 
 
@@ -312,70 +469,115 @@ def main():
     neck_flag = False
     neck_trigger_time = 0
     blink_trigger_time = 0
+    blink_open_at = 0  # time at which the lids reopen after a blink (0: not blinking)
 
     # quick LED flash on start to indicate boot
-    hw.led_flash(times=2, interval=0.12)
+    hw.led_flash(times=2, interval_ms=120)
+
+    # Bind the names used every cycle as locals: local loads are indexed,
+    # global and attribute loads are dictionary lookups in MicroPython
+    now_ms = monotonic_ms
+    diff = ticks_diff
+    get_mode = hw.get_mode
+    read_inputs = hw.read_inputs
+    led_trigger = hw.led_trigger
+    read_latest = reader.read_latest
+    move_eyes = controller.move_eyes
+    lid_sync = controller.lid_sync
+    neck_smooth_move = controller.neck_smooth_move
+    eyes_hor = controller.servo_eyes_hor
+    eyes_ver = controller.servo_eyes_ver
+    deadzone_neck = DEADZONE_NECK
+    cycle_time_ms = CYCLE_TIME_MS
+    max_cycle_lag_ms = MAX_CYCLE_LAG_MS
+    mode_hold = Mode.HOLD
+    mode_mask = 1 << MODE_PIN
+    enable_mask = 1 << ENABLE_PIN
 
     logger.info("Starting main loop")
+    # end of the current cycle; advanced by a fixed period so that a short
+    # overrun is made up by the following cycles instead of being dropped
+    next_cycle_at = now_ms()
+    # set by a RELAX command: acknowledged once the servos are relaxed
+    relax_requested = False
     try:
         # main loop
         while True:
-            cycle_start = monotonic_ms()
-            mode = hw.get_mode()
-            if mode == Mode.HOLD:
-                controller.sweep()
-            elif mode == Mode.AUTO:
+            # one clock read per iteration, shared by all timing checks below
+            cycle_start = now_ms()
+            # mode and enable switch from one GPIO read
+            inputs = read_inputs()
+            if not inputs & mode_mask:
+                # hold mode: stop sweeping as soon as the mode switch leaves HOLD
+                controller.sweep(keep_going=lambda: get_mode() == mode_hold)
+            else:
                 # auto mode
-                if hw.is_enabled():
-                    read_line = reader.read_latest()
+                if inputs & enable_mask:
+                    read_line = read_latest()
                     if read_line is not None:
                         (x_err, y_err, relax_cmd) = read_line
 
                         if relax_cmd is not None and relax_cmd:
-                            logger.info("ACK_RELAX received, exiting main loop")
+                            logger.info("RELAX received, exiting main loop")
+                            relax_requested = True
                             break
                         elif x_err is not None and y_err is not None:
-                            logger.debug(f"Received position error: {x_err},{y_err}")
+                            if LOG_DEBUG:
+                                logger.debug("Received position error: %d,%d", x_err, y_err)
                             # move eyes/eyelids
-                            controller.move_eyes(x_err, y_err)
+                            move_eyes(x_err, y_err)
 
                     # random blink
-                    if (blink_trigger_time == 0) or (monotonic_ms() > blink_trigger_time):
-                        blink_trigger_time = monotonic_ms() + MIN_BLINK_WAIT_MS + random.randint(0, MAX_BLINK_WAIT_MS - MIN_BLINK_WAIT_MS)
+                    # the random wait is only drawn when a blink fires, never per cycle
+                    if (blink_trigger_time == 0) or diff(cycle_start, blink_trigger_time) > 0:
+                        blink_trigger_time = ticks_add(cycle_start, _next_blink_wait_ms())
                         controller.blink_eyes()
-                        time.sleep(BLINK_TIME_S)
+                        # reopen later instead of blocking the loop for the blink
+                        blink_open_at = ticks_add(cycle_start, BLINK_TIME_MS)
+                    elif blink_open_at and diff(cycle_start, blink_open_at) >= 0:
+                        blink_open_at = 0
 
-                    # keep lids synced to UD position
-                    controller.lid_sync()
+                    # keep lids synced to UD position; this also reopens them
+                    # once a blink is over
+                    if not blink_open_at:
+                        lid_sync()
 
                     # decide if neck should move
                     if (
-                        abs(controller.servo_eyes_ver.target - controller.servo_eyes_ver.default) >= DEADZONE_NECK
-                        or abs(controller.servo_eyes_hor.target - controller.servo_eyes_hor.default) >= DEADZONE_NECK
+                        abs(eyes_ver.target - eyes_ver.default) >= deadzone_neck
+                        or abs(eyes_hor.target - eyes_hor.default) >= deadzone_neck
                     ):
                         if not neck_flag:
-                            neck_trigger_time = monotonic_ms()
+                            neck_trigger_time = cycle_start
                             neck_flag = True
 
-                        if neck_flag and (monotonic_ms() - neck_trigger_time) >= NECK_DELAY_MS:
+                        if neck_flag and diff(cycle_start, neck_trigger_time) >= NECK_DELAY_MS:
                             controller.neck_target()
                             neck_flag = False
 
-                    controller.neck_smooth_move()
-
-                    elapsed_ms = monotonic_ms() - cycle_start
-                    wait_s = max(0, CYCLE_TIME_S - (elapsed_ms / 1000.0))
-                    if wait_s > 0:
-                        time.sleep(wait_s)
-                    hw.led_trigger()
+                    neck_smooth_move(cycle_start)
+
+                    next_cycle_at = ticks_add(next_cycle_at, cycle_time_ms)
+                    now = now_ms()
+                    wait_ms = diff(next_cycle_at, now)
+                    if wait_ms > 0:
+                        sleep_ms(wait_ms)
+                    elif wait_ms < -max_cycle_lag_ms:
+                        # too far behind (long overrun, sweep or disabled
+                        # phase): restart the schedule instead of catching up
+                        next_cycle_at = now
+                    led_trigger()
                 else:
                     logger.info("Disabled")
-                    time.sleep(DISABLE_SLEEP_S)
+                    sleep_ms(DISABLE_SLEEP_MS)
     except Exception as e:
         logger.exception(f"Uncaught exception in main loop: {e}")
     finally:
         logger.info("Main loop ended, relaxing servos")
         controller.relax()  
+        if relax_requested:
+            # the host waits for exactly this line before closing the port
+            logger.info("ACK_RELAX")
 
 
 if __name__ == "__main__":
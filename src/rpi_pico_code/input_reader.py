@@ -1,50 +1,116 @@
 import sys
 import select
+import array
 import logging
 
+from mp_compat import micropython, const, ptr8, ptr32
+
+# 1: compile in the per-line debug logging; with 0 the MicroPython compiler
+# drops these branches entirely
+LOG_DEBUG = const(0)
+
 from remote_logger import get_remote_logger
-logger = get_remote_logger(__name__)
+logger = get_remote_logger(__name__, level=logging.DEBUG if LOG_DEBUG else logging.INFO)
+
+
+@micropython.viper
+def _parse_position(line, out) -> int:
+    """Parse b"<int>,<int>" (surrounding whitespace allowed) into out[0], out[1].
+
+    Scans the bytes directly instead of strip()/split()/int(), so no
+    temporary strings are created. Returns 1 on success, 0 for invalid data.
+    """
+    buf = ptr8(line)
+    res = ptr32(out)
+    i = 0
+    n = int(len(line))
+    # trim whitespace and control characters (\r, \n) on both ends
+    while i < n and int(buf[i]) <= 32:
+        i += 1
+    while n > i and int(buf[n - 1]) <= 32:
+        n -= 1
+    field = 0
+    while field < 2:
+        neg = 0
+        if i < n and int(buf[i]) == 45:  # '-'
+            neg = 1
+            i += 1
+        elif i < n and int(buf[i]) == 43:  # '+'
+            i += 1
+        start = i
+        acc = 0
+        while i < n:
+            digit = int(buf[i]) - 48
+            if digit < 0 or digit > 9:
+                break
+            acc = acc * 10 + digit
+            i += 1
+        if i == start:
+            return 0
+        if neg:
+            acc = 0 - acc
+        res[field] = acc
+        field += 1
+        if field == 1:
+            if i >= n or int(buf[i]) != 44:  # ','
+                return 0
+            i += 1
+    if i != n:
+        return 0
+    return 1
 
 
 class InputReader:
     """Non-blocking stdin reader that returns the latest x,y pair or None.
-    
+
     Also handles special commands like 'RELAX' for servo control.
     """
-    
+
+    # decode_line() result buffer: x, y
+    _position = array.array('i', (0, 0))
+
+    def __init__(self):
+        # One poll object registered once, instead of building the fd lists
+        # of select.select() on every check
+        self._poll = select.poll()
+        self._poll.register(sys.stdin, select.POLLIN)
+
     @staticmethod
-    def decode_line(line) -> tuple[int | None, int | None, bool | None]:
+    def decode_line(line: bytes) -> tuple[int | None, int | None, bool | None]:
         """Decode a line of positional data or a special command.
         Returns:
             - (x, y, False) when receiving valid positional data
             - (None, None, True) for relax command
             - (None, None, None) for invalid data
         """
-        stripped = line.strip()
+        # Try to decode as position data
+        position = InputReader._position
+        if _parse_position(line, position):
+            x, y = position[0], position[1]
+            if LOG_DEBUG:
+                logger.debug("Decoded position from input: x=%d, y=%d", x, y)
+            return x, y, False
         # Check for special commands
-        if stripped == "RELAX":
+        if line.strip() == b"RELAX":
             logger.info("Received RELAX command from input.")
             return None, None, True
-        # Try to decode as position data
-        try:
-            x_str, y_str = stripped.split(",")
-            x, y = int(x_str), int(y_str)
-            logger.debug(f"Decoded position from input: x={x}, y={y}")
-            return x, y, False
-        except Exception as e:
-            logger.warning(f"Invalid input data: '{line.strip()}'. Error: {e}")
-            return None, None, None
+        logger.warning("Invalid input data: %r", line)
+        return None, None, None
 
-    @staticmethod
-    def read_latest() -> tuple[int | None, int | None, bool | None]:
+    def read_latest(self) -> tuple[int | None, int | None, bool | None]:
         """Read the latest line from stdin without blocking."""
         latest_line = None
-        while sys.stdin in select.select([sys.stdin], [], [], 0)[0]:
-            latest_line = sys.stdin.readline()
-            logger.debug(f"Read line from stdin: {latest_line.strip()}")
+        poll = self._poll.poll
+        readline = sys.stdin.buffer.readline
+        # Older pending lines are only skipped: no logging or decoding per line
+        while poll(0):
+            latest_line = readline()
 
         if not latest_line:
-            logger.debug("No input received from stdin.")
+            if LOG_DEBUG:
+                logger.debug("No input received from stdin.")
             return None, None, None
 
+        if LOG_DEBUG:
+            logger.debug("Read line from stdin: %r", latest_line)
         return InputReader.decode_line(latest_line)
@@ -0,0 +1,34 @@
+"""MicroPython-only names used by the Pico code, with CPython fallbacks.
+
+On the Pico the real micropython module is used. Under CPython (tests,
+development) the native/viper code emitters do not exist, so the decorated
+functions simply run as plain Python.
+"""
+
+try:
+    import micropython
+    from micropython import const
+except ImportError:
+    class micropython:
+        @staticmethod
+        def viper(func):
+            return func
+
+        native = viper
+
+    def const(value):
+        return value
+
+
+def ptr8(obj):
+    """Plain-Python stand-in for the viper pointer casts (the viper compiler
+    handles ptr8/ptr32 itself): index the buffer directly."""
+    return obj
+
+
+ptr32 = ptr8
+
+
+def uint(value):
+    """Plain-Python stand-in for the viper uint cast: wrap to 32 bits."""
+    return value & 0xFFFFFFFF
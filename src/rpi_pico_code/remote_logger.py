@@ -2,6 +2,15 @@ import logging
 import sys
 
 
+# CPython renders msg % args in LogRecord.getMessage(); MicroPython's logging
+# stores the rendered text as record.message
+if hasattr(logging.LogRecord, 'getMessage'):
+    _record_message = logging.LogRecord.getMessage
+else:
+    def _record_message(record):
+        return record.message
+
+
 class CustomFormatter(logging.Formatter):
     LEVEL_PREFIX = {
         logging.DEBUG: 'D:',
@@ -11,16 +20,31 @@ class CustomFormatter(logging.Formatter):
         logging.CRITICAL: 'C:',
     }
 
-    def format(self, record):
-        prefix = self.LEVEL_PREFIX.get(record.levelno, '?')
+    def __init__(self, fmt='%(message)s', *args, **kwargs):
+        super().__init__(fmt, *args, **kwargs)
+        # the plain message needs no Formatter.format() rendering
+        self._message_only = fmt == '%(message)s'
+
+    # the prefix lookup and message accessor are bound as defaults, so each
+    # record resolves them as locals instead of attribute/global loads
+    def format(self, record, _prefix=LEVEL_PREFIX.get, _message=_record_message):
+        prefix = _prefix(record.levelno, '?')
+        if (self._message_only and not getattr(record, 'exc_info', None)
+                and not getattr(record, 'stack_info', None)):
+            return prefix + ' ' + _message(record)
         message = super().format(record)
         return f"{prefix} {message}"
 
 
-def get_remote_logger(name: str) -> logging.Logger:
+# One stdout handler shared by all remote loggers
+_HANDLER = logging.StreamHandler(sys.stdout)
+_HANDLER.setFormatter(CustomFormatter('%(message)s'))
+
+
+def get_remote_logger(name: str, level: int = logging.DEBUG) -> logging.Logger:
     logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(CustomFormatter('%(message)s'))
-    logger.handlers = [handler]
-    return logger
\ No newline at end of file
+    logger.setLevel(level)
+    # attach once; repeated calls for the same name reuse the shared handler
+    if _HANDLER not in logger.handlers:
+        logger.addHandler(_HANDLER)
+    return logger
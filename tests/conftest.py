@@ -0,0 +1,44 @@
+import os
+
+import cv2
+import pytest
+
+from camera_follower_bot import camera_processor as cp
+from camera_follower_bot import run_camera as rc
+
+HERE = os.path.dirname(__file__)
+IMAGE_PATH = os.path.join(HERE, "testimage.png")
+
+
+@pytest.fixture(scope="session")
+def face_detector():
+    """Real MediaPipe detector, built once per test run (loading the model is slow)."""
+    try:
+        # validate model path first
+        rc.validate_model_path(cp.MODEL_PATH)
+    except SystemExit:
+        pytest.skip(f"Model not found at {cp.MODEL_PATH}. Set MODEL_PATH or place tflite model there to run this test.")
+
+    try:
+        detector = cp.make_face_detector(cp.MODEL_PATH)
+    except Exception as exc:
+        pytest.skip(f'Failed to create MediaPipe detector: {exc}')
+    yield detector
+    detector.close()
+
+
+@pytest.fixture(scope="session")
+def test_image():
+    """The decoded static test image, read once per test run."""
+    if not IMAGE_PATH or not os.path.isfile(IMAGE_PATH):
+        pytest.skip(f'Provided test image does not exist: {IMAGE_PATH}')
+    img = cv2.imread(IMAGE_PATH)
+    if img is None:
+        pytest.skip(f'cv2 failed to read image: {IMAGE_PATH}')
+    return img
+
+
+@pytest.fixture
+def tmp_log_file(tmp_path):
+    """Path of a not yet existing log file in the test's temporary directory."""
+    return str(tmp_path / "test.log")
@@ -1,39 +1,14 @@
-import os
-import cv2
-import pytest
-
 from camera_follower_bot import camera_processor as cp
-from camera_follower_bot import run_camera as rc
-
-HERE = os.path.dirname(__file__)
-IMAGE_PATH = os.path.join(HERE, "testimage.png")
 
 
-def test_face_detection_on_static_image():
+def test_face_detection_on_static_image(face_detector, test_image):
     """Run face detection on a static image (as if captured from webcam).
 
-    Provide the image path via the environment variable `CAMERA_TEST_IMAGE`.
-    This test will be skipped with instructions if the model or image are missing.
+    The detector and image come from session fixtures (tests/conftest.py);
+    the test is skipped with instructions if the model or image are missing.
     """
-
-    # Ensure model and mediapipe are available
-    try:
-        # validate model path first
-        rc.validate_model_path(cp.MODEL_PATH)
-    except SystemExit:
-        pytest.skip(f"Model not found at {cp.MODEL_PATH}. Set MODEL_PATH or place tflite model there to run this test.")
-
-    # Build real detector
-    try:
-        detector = cp.make_face_detector(cp.MODEL_PATH)
-    except Exception as exc:
-        pytest.skip(f'Failed to create MediaPipe detector: {exc}')
-
-    if not IMAGE_PATH or not os.path.isfile(IMAGE_PATH):
-        pytest.skip(f'Provided test image does not exist: {IMAGE_PATH}')
-    img = cv2.imread(IMAGE_PATH)
-    if img is None:
-        pytest.skip(f'cv2 failed to read image: {IMAGE_PATH}')
+    detector = face_detector
+    img = test_image
 
     h, w = img.shape[:2]
     center_x = w // 2
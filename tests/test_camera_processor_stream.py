@@ -1,3 +1,8 @@
+import functools
+import os
+import subprocess
+import sys
+
 import cv2
 import numpy as np
 import pytest
@@ -15,53 +20,289 @@ def test_cv2_open_and_close():
     assert not cap.isOpened()
 
 
+# Fake MediaPipe result objects matching the structure used by camera_processor
+class FakeBBox:
+    def __init__(self, origin_x, origin_y, width, height):
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+        self.width = width
+        self.height = height
+
+
+class FakeCategory:
+    def __init__(self, score=0.9):
+        self.score = score
+
+
+class FakeDetection:
+    def __init__(self, bbox, score=0.9):
+        self.bounding_box = bbox
+        self.categories = [FakeCategory(score)]
+
+
+class FakeResults:
+    def __init__(self, detections):
+        self.detections = detections
+
+
+@functools.lru_cache(maxsize=None)
+def make_centered_results(cx, cy, bw=40, bh=60, score=0.98):
+    """Results with one box of bw x bh centered on (cx, cy); cached per geometry."""
+    bbox = FakeBBox(cx - bw // 2, cy - bh // 2, bw, bh)
+    return FakeResults([FakeDetection(bbox, score=score)])
+
+
+class FakeDetector:
+    def detect(self, img_arg):
+        # bounding box centered in the image the detector receives
+        return make_centered_results(img_arg.width // 2, img_arg.height // 2)
+
+
+# Blank 640x480 camera frame shared by the tests; read-only so no test can
+# leak drawings into another one
+FAKE_FRAME = np.zeros((480, 640, 3), dtype=np.uint8)
+FAKE_FRAME.flags.writeable = False
+
+
 def test_process_frame_with_fake_detector():
     """Test process_frame using a synthetic image and a fake detector.
 
-    We create a blank image and a fake detection whose bounding box
-    is centered in the frame; process_frame should return zero errors.
+    We use a blank image and a fake detection whose bounding box
+    is centered in the detector input (which may be downscaled);
+    process_frame should return zero errors.
     """
-    h, w = 480, 640
-    img = np.zeros((h, w, 3), dtype=np.uint8)
-
+    h, w = FAKE_FRAME.shape[:2]
     center_x = w // 2
     center_y = h // 2
 
-    # fake detection objects matching expected structure
-    class FakeBBox:
-        def __init__(self, origin_x, origin_y, width, height):
-            self.origin_x = origin_x
-            self.origin_y = origin_y
-            self.width = width
-            self.height = height
+    annotated, error_x, error_y = cp.process_frame(FAKE_FRAME, FakeDetector(), center_x, center_y)
 
-    class FakeCategory:
-        def __init__(self, score=0.9):
-            self.score = score
+    assert error_x == 0
+    assert error_y == 0
 
-    class FakeDetection:
-        def __init__(self, bbox, score=0.9):
-            self.bounding_box = bbox
-            self.categories = [FakeCategory(score)]
 
-    class FakeResults:
-        def __init__(self, detections):
-            self.detections = detections
+def test_latest_detection_keeps_newest_result():
+    """LatestDetection returns the most recently delivered result and its timestamp."""
+    latest = cp.LatestDetection()
+    assert latest.get() == (None, -1)
 
-    # bounding box centered in the frame
-    bw, bh = 40, 60
-    bbox = FakeBBox(center_x - bw // 2, center_y - bh // 2, bw, bh)
-    detection = FakeDetection(bbox, score=0.98)
-    results = FakeResults([detection])
+    first, second = object(), object()
+    latest.update(first, None, 10)
+    latest.update(second, None, 20)
 
-    class FakeDetector:
-        def detect(self, img_arg):
-            # ignore input and return our fake results
-            return results
+    result, timestamp_ms = latest.get()
+    assert result is second
+    assert timestamp_ms == 20
 
-    det = FakeDetector()
 
-    annotated, error_x, error_y = cp.process_frame(img, det, center_x, center_y)
+def test_to_mp_image_reuses_rgb_buffer():
+    """to_mp_image converts BGR to RGB into the provided buffer."""
+    bgr = np.zeros((4, 6, 3), dtype=np.uint8)
+    bgr[..., 0] = 255  # blue channel
+    rgb_buffer = np.empty_like(bgr)
 
-    assert error_x == 0
-    assert error_y == 0
+    mp_image = cp.to_mp_image(bgr, rgb_buffer)
+
+    assert (rgb_buffer[..., 2] == 255).all()
+    assert (rgb_buffer[..., :2] == 0).all()
+    assert (mp_image.numpy_view() == rgb_buffer).all()
+
+
+@pytest.mark.parametrize("rotate,flip", [(True, True), (True, False), (False, True), (False, False)])
+def test_orient_frame_matches_rotate_and_flip(rotate, flip):
+    """The fused single flip gives the same pixels as rotate-180 followed by a horizontal flip."""
+    img = np.arange(4 * 6 * 3, dtype=np.uint8).reshape(4, 6, 3)
+
+    expected = img
+    if rotate:
+        expected = cv2.rotate(expected, cv2.ROTATE_180)
+    if flip:
+        expected = cv2.flip(expected, 1)
+
+    assert (cp.orient_frame(img, rotate, flip) == expected).all()
+
+
+def test_compute_error_scales_bbox_back_to_frame():
+    """Boxes from a downscaled detector input are mapped back to full-frame pixels."""
+    class BBox:
+        origin_x, origin_y, width, height = 10, 20, 20, 10
+
+    class Detection:
+        bounding_box = BBox()
+
+    # Box center (20, 25) at half resolution is (40, 50) in the full frame
+    error_x, error_y = cp.compute_error(Detection(), 100, 100, detect_scale=0.5)
+    assert (error_x, error_y) == (60, 50)
+    assert cp.downscale_frame(FAKE_FRAME, 0.5).shape == (240, 320, 3)
+
+
+def test_select_target_picks_highest_score():
+    """Only the most confident detection is tracked, regardless of result order."""
+    def detection(score):
+        return type('Detection', (), {'categories': [type('Category', (), {'score': score})()]})()
+
+    low, high = detection(0.6), detection(0.9)
+    assert cp.select_target([low, high, detection(0.7)]) is high
+    assert cp.select_target([low]) is low
+    assert cp.select_target([]) is None
+    assert cp.select_target(None) is None
+
+
+def test_read_latest_frame_skips_buffered_frames():
+    """Buffered frames are grabbed without decoding; only the newest is retrieved."""
+    class BufferedCap:
+        def __init__(self):
+            self.grabbed = 0
+            self.retrieved = 0
+
+        def grab(self):
+            self.grabbed += 1
+            return True
+
+        def retrieve(self):
+            self.retrieved += 1
+            return True, self.grabbed
+
+    cap = BufferedCap()
+    assert cp.read_latest_frame(cap, max_grabs=3) == (True, 3)
+    assert cap.retrieved == 1
+
+    # A grab that blocks has waited for a fresh frame: stop grabbing right away
+    cap = BufferedCap()
+    assert cp.read_latest_frame(cap, max_grabs=3, fresh_grab_ns=0) == (True, 1)
+
+
+def test_import_defers_mediapipe():
+    """Importing the module must not pay for MediaPipe until a detector or image is needed."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = (
+        "import sys; sys.path[:0] = ['src', '.']\n"
+        "import camera_follower_bot.camera_processor\n"
+        "assert 'mediapipe' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
+
+def test_make_face_detector_rejects_unknown_delegate():
+    """Only delegates supported by MediaPipe Tasks are accepted."""
+    with pytest.raises(ValueError):
+        cp.make_face_detector(cp.MODEL_PATH, delegate='edgetpu')
+
+
+def test_motion_gate_skips_static_frames_while_result_is_fresh():
+    """Static frames skip detection until the result ages or the refresh count is reached."""
+    gate = cp.MotionGate(threshold=2.0, max_result_age_ms=500, refresh_frames=2)
+    still = np.zeros((240, 320, 3), dtype=np.uint8)
+    moved = np.full((240, 320, 3), 255, dtype=np.uint8)
+
+    assert gate.should_detect(still, -1) is True  # no reference yet
+    assert gate.should_detect(still, 10) is False
+    assert gate.should_detect(still, 10) is False
+    assert gate.should_detect(still, 10) is True  # refresh after 2 skipped frames
+    assert gate.should_detect(still, 600) is True  # result too old
+    assert gate.should_detect(moved, 10) is True  # scene changed
+
+
+def test_to_mp_image_converts_in_place():
+    """Passing the frame as its own buffer converts it to RGB in place."""
+    bgr = np.zeros((4, 6, 3), dtype=np.uint8)
+    bgr[..., 0] = 255  # blue channel
+
+    mp_image = cp.to_mp_image(bgr, bgr)
+
+    assert (bgr[..., 2] == 255).all()
+    assert (mp_image.numpy_view()[..., 2] == 255).all()
+
+
+class FakeAsyncDetector:
+    """LIVE_STREAM detector double: delivers a centered box for every submitted frame."""
+    def __init__(self, result_callback):
+        self.result_callback = result_callback
+        self.submitted = 0
+        self.closed = False
+
+    def detect_async(self, mp_image, timestamp_ms):
+        self.submitted += 1
+        results = make_centered_results(mp_image.width // 2, mp_image.height // 2)
+        self.result_callback(results, mp_image, timestamp_ms)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeCapture:
+    """Camera double that delivers `frames` copies of FAKE_FRAME, then ends."""
+    def __init__(self, frames):
+        self.frames = frames
+        self.released = False
+
+    def isOpened(self):
+        return not self.released
+
+    def grab(self):
+        if not self.frames:
+            return False
+        self.frames -= 1
+        return True
+
+    def retrieve(self):
+        return True, FAKE_FRAME
+
+    def release(self):
+        self.released = True
+
+
+def run_main(monkeypatch, serial_manager_factory, frames=30):
+    """Run cp.main() headless against the fakes; returns (capture, detector)."""
+    h, w = FAKE_FRAME.shape[:2]
+    cap = FakeCapture(frames)
+    detectors = []
+
+    def make_detector(model_path, result_callback=None, **kwargs):
+        detectors.append(FakeAsyncDetector(result_callback))
+        return detectors[-1]
+
+    polls = [0]
+
+    def poll_key():
+        # press Esc eventually, so a tracker that never stops fails the test
+        # instead of hanging it
+        polls[0] += 1
+        return 27 if polls[0] > 500 else -1
+
+    monkeypatch.setattr(cp, 'SerialManager', serial_manager_factory)
+    monkeypatch.setattr(cp, 'make_face_detector', make_detector)
+    monkeypatch.setattr(cp, 'open_camera', lambda *a, **kw: (cap, w, h, w // 2, h // 2))
+    monkeypatch.setattr(cp, '_pollKey', poll_key)
+    monkeypatch.setattr(cp.cv2, 'imshow', lambda *a: None)
+    monkeypatch.setattr(cp.cv2, 'destroyAllWindows', lambda: None)
+    cp.main()
+    return cap, detectors[0]
+
+
+def test_main_runs_with_dummy_serial_manager(monkeypatch):
+    """--no-serial: main() tracks until the camera ends using run_camera's DummySerialManager."""
+    from camera_follower_bot import run_camera as rc
+
+    cap, detector = run_main(monkeypatch, rc.DummySerialManager)
+
+    assert cap.frames == 0  # ended because the camera ran out, not by Esc
+    assert cap.released
+    assert detector.submitted > 0
+    assert detector.closed
+
+
+def test_main_reports_tracker_setup_errors(monkeypatch):
+    """A serial manager missing a method stops main() with the error instead of hanging it."""
+    class IncompleteSerialManager:
+        port = 'test'
+        baud = None
+
+        def connect(self):
+            return False
+
+        def close(self):
+            pass
+
+    with pytest.raises(AttributeError):
+        run_main(monkeypatch, IncompleteSerialManager)
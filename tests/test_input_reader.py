@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pytest
+
+from rpi_pico_code.input_reader import InputReader
+
+
+@pytest.fixture
+def stdin_pipe(monkeypatch):
+    read_fd, write_fd = os.pipe()
+    reader = os.fdopen(read_fd, 'r')
+    writer = os.fdopen(write_fd, 'w')
+    monkeypatch.setattr(sys, 'stdin', reader)
+    yield writer
+    writer.close()
+    reader.close()
+
+
+def test_read_latest_reuses_poll_object(stdin_pipe):
+    input_reader = InputReader()
+    poll = input_reader._poll
+    for line, expected in (("1,2\n", (1, 2, False)), ("-3,4\n", (-3, 4, False))):
+        stdin_pipe.write(line)
+        stdin_pipe.flush()
+        assert input_reader.read_latest() == expected
+    assert input_reader._poll is poll
+
+
+def test_read_latest_without_input(stdin_pipe):
+    input_reader = InputReader()
+    assert input_reader.read_latest() == (None, None, None)
@@ -1,12 +1,16 @@
 """Tests for logging configuration module."""
 import logging
-import os
-import tempfile
 import pytest
 
 from camera_follower_bot import logging_config
 
 
+def _close_handlers(logger):
+    for handler in logger.handlers:
+        handler.close()
+    logger.handlers.clear()
+
+
 def test_get_log_level_from_env_default(monkeypatch):
     """Test that default log level is INFO when LOG_LEVEL is not set."""
     monkeypatch.delenv("LOG_LEVEL", raising=False)
@@ -73,6 +77,17 @@ def test_setup_logging_with_custom_level():
     logger.handlers.clear()
 
 
+def test_setup_logging_with_level_name():
+    """Test that setup_logging accepts level names and falls back to the default for unknown ones."""
+    logger = logging_config.setup_logging("test_logger_level_name", level="debug")
+    assert logger.level == logging.DEBUG
+    logger.handlers.clear()
+
+    logger = logging_config.setup_logging("test_logger_level_invalid", level="INVALID")
+    assert logger.level == logging_config.DEFAULT_LOG_LEVEL
+    logger.handlers.clear()
+
+
 def test_setup_logging_adds_stdout_handler():
     """Test that setup_logging adds a stdout handler."""
     logger = logging_config.setup_logging("test_logger_stdout")
@@ -82,39 +97,27 @@ def test_setup_logging_adds_stdout_handler():
     logger.handlers.clear()
 
 
-def test_setup_logging_with_file(monkeypatch):
+def test_setup_logging_with_file(monkeypatch, tmp_log_file):
     """Test that setup_logging adds a file handler when log_file is provided."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.log') as f:
-        log_file = f.name
-    
+    logger = logging_config.setup_logging("test_logger_file", log_file=tmp_log_file)
     try:
-        logger = logging_config.setup_logging("test_logger_file", log_file=log_file)
         assert len(logger.handlers) >= 2
         assert any(isinstance(h, logging.FileHandler) for h in logger.handlers)
-        
-        # Clean up
-        logger.handlers.clear()
     finally:
-        if os.path.exists(log_file):
-            os.unlink(log_file)
+        # Clean up; closing releases the file before it is removed
+        _close_handlers(logger)
 
 
-def test_setup_logging_with_log_file_env(monkeypatch):
+def test_setup_logging_with_log_file_env(monkeypatch, tmp_log_file):
     """Test that setup_logging uses LOG_FILE environment variable."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.log') as f:
-        log_file = f.name
-    
+    monkeypatch.setenv("LOG_FILE", tmp_log_file)
+    logger = logging_config.setup_logging("test_logger_env_file")
     try:
-        monkeypatch.setenv("LOG_FILE", log_file)
-        logger = logging_config.setup_logging("test_logger_env_file")
         assert len(logger.handlers) >= 2
         assert any(isinstance(h, logging.FileHandler) for h in logger.handlers)
-        
-        # Clean up
-        logger.handlers.clear()
     finally:
-        if os.path.exists(log_file):
-            os.unlink(log_file)
+        # Clean up
+        _close_handlers(logger)
 
 
 def test_setup_logging_file_handler_failure(monkeypatch):
@@ -205,26 +208,20 @@ def test_setup_logging_custom_date_format():
     logger.handlers.clear()
 
 
-def test_logging_output_to_file():
+def test_logging_output_to_file(tmp_log_file):
     """Test that logging actually writes to file."""
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.log') as f:
-        log_file = f.name
-    
+    logger = logging_config.setup_logging("test_file_output", log_file=tmp_log_file)
     try:
-        logger = logging_config.setup_logging("test_file_output", log_file=log_file)
         logger.info("Test message")
-        
+
         # Flush and read the log file
         for handler in logger.handlers:
             handler.flush()
-        
-        with open(log_file, 'r') as f:
+
+        with open(tmp_log_file, 'r') as f:
             content = f.read()
             assert "Test message" in content
             assert "INFO" in content
-        
-        # Clean up
-        logger.handlers.clear()
     finally:
-        if os.path.exists(log_file):
-            os.unlink(log_file)
+        # Clean up
+        _close_handlers(logger)
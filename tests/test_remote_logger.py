@@ -0,0 +1,41 @@
+import logging
+import sys
+
+from rpi_pico_code.remote_logger import CustomFormatter, get_remote_logger
+
+
+def test_get_remote_logger_attaches_handler_once():
+    first = get_remote_logger("test_remote_logger.once")
+    second = get_remote_logger("test_remote_logger.once", level=logging.INFO)
+    assert first is second
+    assert len(second.handlers) == 1
+    assert second.level == logging.INFO
+
+
+def test_loggers_share_one_handler():
+    a = get_remote_logger("test_remote_logger.a")
+    b = get_remote_logger("test_remote_logger.b")
+    assert a.handlers[0] is b.handlers[0]
+
+
+def test_custom_formatter_prefixes_level():
+    formatter = CustomFormatter('%(message)s')
+    record = logging.LogRecord("x", logging.WARNING, __file__, 1, "value %d", (3,), None)
+    assert formatter.format(record) == "W: value 3"
+
+
+def test_custom_formatter_keeps_exception_text():
+    formatter = CustomFormatter('%(message)s')
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord("x", logging.ERROR, __file__, 1, "failed", (), sys.exc_info())
+    text = formatter.format(record)
+    assert text.startswith("E: failed\n")
+    assert "ValueError: boom" in text
+
+
+def test_custom_formatter_with_other_format():
+    formatter = CustomFormatter('%(name)s %(message)s')
+    record = logging.LogRecord("x", logging.INFO, __file__, 1, "hi", (), None)
+    assert formatter.format(record) == "I: x hi"
@@ -1,9 +1,12 @@
+import inspect
 import os
+import subprocess
 import sys
 import tempfile
 import pytest
 
 from camera_follower_bot import run_camera as rc
+from camera_follower_bot import serial_manager as sm
 
 
 def test_validate_model_path_fails_on_missing(tmp_path, monkeypatch):
@@ -17,8 +20,54 @@ def test_validate_model_path_fails_on_missing(tmp_path, monkeypatch):
     assert excinfo.value.code == 2
 
 
+def test_package_import_is_lazy():
+    """Importing the package must not load the camera / serial submodules."""
+    code = (
+        "import sys\n"
+        "import camera_follower_bot\n"
+        "assert 'camera_follower_bot.camera_processor' not in sys.modules\n"
+        "assert 'cv2' not in sys.modules\n"
+        "assert camera_follower_bot.logging_config.DEFAULT_LOG_LEVEL\n"
+    )
+    src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+    subprocess.run([sys.executable, '-c', code], cwd=src, check=True)
+
+
+def test_dummy_serial_manager_matches_serial_manager_methods():
+    """--no-serial hands DummySerialManager to main(): it must offer every public method."""
+    def public_methods(cls):
+        return {name for name, value in vars(cls).items()
+                if not name.startswith('_') and inspect.isfunction(value)}
+
+    assert public_methods(rc.DummySerialManager) == public_methods(sm.SerialManager)
+
+
 def test_validate_model_path_passes_with_file(tmp_path):
     p = tmp_path / 'model.tflite'
     p.write_bytes(b'data')
     # should not raise
     rc.validate_model_path(str(p))
+
+
+@pytest.mark.parametrize("machine,expected", [
+    ('aarch64', True),
+    ('armv7l', True),
+    ('arm64', True),
+    ('x86_64', False),
+    ('AMD64', False),
+])
+def test_prefer_quantized_model_on_arm(tmp_path, machine, expected):
+    p = tmp_path / 'model_int8.tflite'
+    p.write_bytes(b'data')
+    assert rc.prefer_quantized_model(str(p), machine=machine) is expected
+
+
+def test_prefer_quantized_model_requires_file(tmp_path):
+    assert rc.prefer_quantized_model(str(tmp_path / 'missing.tflite'), machine='aarch64') is False
+
+
+def test_quantized_flag_is_tristate():
+    parser = rc.build_parser()
+    assert parser.parse_args([]).quantized is None
+    assert parser.parse_args(['--quantized']).quantized is True
+    assert parser.parse_args(['--no-quantized']).quantized is False
@@ -1,4 +1,6 @@
 import time
+from types import SimpleNamespace
+
 import pytest
 
 from camera_follower_bot import serial_manager as sm
@@ -16,22 +18,92 @@ class DummySerialOK:
         self.is_open = False
 
 
+def _patch_serial(monkeypatch, serial_cls):
+    """Make SerialManager open ports through `serial_cls` instead of pyserial."""
+    monkeypatch.setattr(sm, 'serial', SimpleNamespace(Serial=serial_cls))
+
+
+@pytest.fixture(autouse=True)
+def no_reset_delay(monkeypatch):
+    # Tests exercise a ready port unless they opt into the reset delay
+    monkeypatch.setattr(sm, 'SERIAL_RESET_DELAY_S', 0.0)
+
+
 class DummySerialFail:
     def __init__(self, *args, **kwargs):
         raise RuntimeError("port error")
 
 
+class DummySerialWriteLog:
+    """Open port that records every write."""
+    def __init__(self, *args, **kwargs):
+        self.is_open = True
+        self.written = []
+
+    def write(self, data):
+        self.written.append(bytes(data))
+
+
+class DummySerialRelaxAck(DummySerialWriteLog):
+    """Port whose device relaxes the servos on RELAX and then acknowledges it."""
+    # as printed by the firmware's remote logger (MicroPython stdout sends CRLF)
+    RESPONSE = (b'I: RELAX received, exiting main loop\r\n'
+                b'I: Main loop ended, relaxing servos\r\n'
+                b'I: ACK_RELAX\r\n')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._response = self.RESPONSE
+        self.timeout = 1.0
+
+    def read_until(self, expected, size):
+        if not self.is_open:
+            return b''
+        end = self._response.find(expected)
+        end = size if end < 0 else min(end + len(expected), size)
+        data = self._response[:end]
+        self._response = self._response[end:]
+        return data
+
+    def close(self):
+        self.is_open = False
+
+
 def test_connect_success(monkeypatch):
-    monkeypatch.setattr(sm, 'serial', type('X', (), {'Serial': DummySerialOK}))
+    _patch_serial(monkeypatch, DummySerialOK)
     mgr = sm.SerialManager(min_backoff=0.1, max_backoff=1.0)
     assert mgr.connect() is True
     assert mgr.is_connected() is True
 
 
+def test_connect_waits_for_reset_without_blocking(monkeypatch):
+    _patch_serial(monkeypatch, DummySerialOK)
+    clock = [100.0]
+    monkeypatch.setattr(sm.time, 'monotonic', lambda: clock[0])
+    mgr = sm.SerialManager(reset_delay=2.0)
+    assert mgr.connect() is True
+    # port is open but the device is still resetting
+    assert mgr.ser is not None
+    assert mgr.is_connected() is False
+    assert mgr.write(b"1,2\n") is False
+    assert not hasattr(mgr.ser, '_last')
+    clock[0] = 102.0
+    assert mgr.is_connected() is True
+    assert mgr.write(b"1,2\n") is True
+    assert mgr.ser._last == b"1,2\n"
+
+
+def test_serial_manager_has_no_instance_dict():
+    mgr = sm.SerialManager()
+    assert not hasattr(mgr, '__dict__')
+    with pytest.raises(AttributeError):
+        mgr.unknown_attribute = 1
+
+
 def test_connect_failure(monkeypatch):
-    monkeypatch.setattr(sm, 'serial', type('X', (), {'Serial': DummySerialFail}))
+    _patch_serial(monkeypatch, DummySerialFail)
     mgr = sm.SerialManager(min_backoff=0.01, max_backoff=0.02)
-    before = time.time()
+    before = time.monotonic()
     assert mgr.connect() is False
     assert mgr.ser is None
     assert mgr.attempt_count == 1
@@ -39,11 +111,43 @@ def test_connect_failure(monkeypatch):
     assert mgr.next_attempt_time >= before
 
 
+def test_reconnect_backoff_doubles_with_jitter(monkeypatch):
+    _patch_serial(monkeypatch, DummySerialFail)
+    monkeypatch.setattr(sm.time, 'monotonic', lambda: 100.0)
+    jitter = [0.0]
+    monkeypatch.setattr(sm.random, 'random', lambda: jitter[0])
+    mgr = sm.SerialManager(min_backoff=0.5, max_backoff=30.0)
+    delays = []
+    for _ in range(4):
+        mgr.connect()
+        delays.append(mgr.next_attempt_time - 100.0)
+    assert delays == [0.5, 1.0, 2.0, 4.0]
+    # the largest jitter cuts a quarter off the backoff
+    jitter[0] = 1.0
+    mgr.connect()
+    assert mgr.next_attempt_time - 100.0 == pytest.approx(8.0 * 0.75)
+
+
+def test_reconnect_uses_cached_monotonic_time(monkeypatch):
+    _patch_serial(monkeypatch, DummySerialFail)
+    mgr = sm.SerialManager(min_backoff=0.5, max_backoff=30.0)
+    # Long outages must keep the backoff capped instead of overflowing
+    mgr.attempt_count = 5000
+    assert mgr.connect() is False
+    assert mgr.next_attempt_time <= time.monotonic() + 30.0
+
+    # A caller-provided timestamp before the deadline skips the attempt
+    mgr.reconnect_if_needed(mgr.next_attempt_time - 1.0)
+    assert mgr.attempt_count == 5001
+    mgr.reconnect_if_needed(mgr.next_attempt_time)
+    assert mgr.attempt_count == 5002
+
+
 def test_write_handles_exception_and_schedules_reconnect(monkeypatch):
     # First connect returns object whose write raises
     class WFail:
         def __init__(self, *a, **kw):
-            pass
+            self.is_open = True
 
         def write(self, data):
             raise RuntimeError('write failed')
@@ -51,7 +155,7 @@ def test_write_handles_exception_and_schedules_reconnect(monkeypatch):
         def close(self):
             pass
 
-    monkeypatch.setattr(sm, 'serial', type('X', (), {'Serial': WFail}))
+    _patch_serial(monkeypatch, WFail)
     mgr = sm.SerialManager(min_backoff=0.01, max_backoff=0.02)
     # connect succeeds (constructor returns instance)
     assert mgr.connect() is True
@@ -63,26 +167,93 @@ def test_write_handles_exception_and_schedules_reconnect(monkeypatch):
 
 
 def test_send_position_formats_and_writes(monkeypatch):
-    written = {}
+    _patch_serial(monkeypatch, DummySerialWriteLog)
+    mgr = sm.SerialManager()
+    assert mgr.connect() is True
+    ok = mgr.send_position(10, -5)
+    assert ok is True
+    assert mgr.ser.written == [b'10,-5\n']
+
 
-    class WGood:
+def test_send_position_coalesces_writes(monkeypatch):
+    """Sends within the flush interval are buffered and written together."""
+    _patch_serial(monkeypatch, DummySerialWriteLog)
+    mgr = sm.SerialManager()
+    assert mgr.connect() is True
+    written = mgr.ser.written
+    # Freeze the clock so only the byte threshold can trigger a flush
+    monkeypatch.setattr(sm.time, 'monotonic_ns', lambda: 10**12)
+
+    assert mgr.send_position(1, 2) is True  # first send flushes immediately
+    assert written == [b'1,2\n']
+
+    payload = b'-100,-100\n'
+    sends = sm.TX_FLUSH_BYTES // len(payload) + 1
+    for _ in range(sends - 1):
+        assert mgr.send_position(-100, -100) is True
+    assert written == [b'1,2\n']  # still buffered
+
+    assert mgr.send_position(-100, -100) is True
+    assert written == [b'1,2\n', payload * sends]
+
+
+def test_flush_if_due_writes_buffered_position_without_new_send(monkeypatch):
+    """A buffered payload goes out once the flush interval passed, with no further send."""
+    _patch_serial(monkeypatch, DummySerialWriteLog)
+    clock = [10**12]
+    monkeypatch.setattr(sm.time, 'monotonic_ns', lambda: clock[0])
+    mgr = sm.SerialManager()
+    assert mgr.connect() is True
+    written = mgr.ser.written
+
+    assert mgr.send_position(1, 2) is True  # first send flushes immediately
+    assert mgr.send_position(3, 4) is True  # buffered
+    assert mgr.flush_if_due() is True
+    assert written == [b'1,2\n']  # interval not over yet
+
+    clock[0] += sm.TX_FLUSH_INTERVAL_NS
+    assert mgr.flush_if_due() is True
+    assert written == [b'1,2\n', b'3,4\n']
+    # nothing pending: no empty write
+    clock[0] += sm.TX_FLUSH_INTERVAL_NS
+    assert mgr.flush_if_due() is True
+    assert written == [b'1,2\n', b'3,4\n']
+
+
+def test_close_flushes_pending_positions(monkeypatch):
+    written = []
+
+    class Recorder:
         def __init__(self, *a, **kw):
-            pass
+            self.is_open = True
+            self.in_waiting = 0
+            self.timeout = 1.0
 
         def write(self, data):
-            written['data'] = data
+            written.append(bytes(data))
+
+        def read_until(self, expected, size):
+            return b''
+
+        def close(self):
+            self.is_open = False
 
-    monkeypatch.setattr(sm, 'serial', type('X', (), {'Serial': WGood}))
+    _patch_serial(monkeypatch, Recorder)
+    monkeypatch.setattr(sm.time, 'monotonic_ns', lambda: 10**12)
     mgr = sm.SerialManager()
     assert mgr.connect() is True
-    ok = mgr.send_position(10, -5)
-    assert ok is True
-    assert written['data'] == b'10,-5\n'
+    assert mgr.send_position(1, 2) is True  # first send flushes
+    assert mgr.send_position(3, 4) is True  # buffered
+    assert written == [b'1,2\n']
+
+    mgr.close()
+    assert written[1] == b'3,4\n'
+    assert written[2] == b'RELAX\n'
 
 
 def test_read_stdout_when_not_connected(monkeypatch):
     """Test that read_stdout returns False when not connected."""
-    monkeypatch.setattr(sm, 'serial', type('X', (), {'Serial': DummySerialFail}))
+    _patch_serial(monkeypatch, DummySerialFail)
     mgr = sm.SerialManager(min_backoff=0.01, max_backoff=0.02)
     assert mgr.connect() is False
     result = mgr.read_stdout()
@@ -99,25 +270,85 @@ def test_read_stdout_with_no_data(monkeypatch):
         def write(self, data):
             pass
 
-    monkeypatch.setattr(sm, 'serial', type('X', (), {'Serial': SerialNoData}))
+    _patch_serial(monkeypatch, SerialNoData)
     mgr = sm.SerialManager()
     assert mgr.connect() is True
     result = mgr.read_stdout()
     assert result is False
 
 
-def test_read_stdout_with_single_line(monkeypatch):
-    """Test reading a single complete line from stdout."""
-    class SerialWithData:
+@pytest.fixture
+def fake_serial(monkeypatch):
+    """Return a factory for a connected manager whose port yields `chunks`, one per read().
+
+    Keyword arguments of the factory are passed on to SerialManager.
+    """
+    def _make(chunks, **manager_kwargs):
+        class FakeSerial:
+            def __init__(self, *a, **kw):
+                self.is_open = True
+                self.chunks = list(chunks)
+
+            @property
+            def in_waiting(self):
+                return len(self.chunks[0]) if self.chunks else 0
+
+            def read(self, size):
+                return self.chunks.pop(0)
+
+            def write(self, data):
+                pass
+
+        _patch_serial(monkeypatch, FakeSerial)
+        mgr = sm.SerialManager(**manager_kwargs)
+        assert mgr.connect() is True
+        return mgr
+    return _make
+
+
+@pytest.mark.parametrize("chunks,expected", [
+    ([b'Hello World\n'], [['Hello World']]),
+    ([b'Line 1\nLine 2\nLine 3\n'], [['Line 1', 'Line 2', 'Line 3']]),
+    # a partial line is kept until its newline arrives
+    ([b'Hello Wor', b'ld!\n'], [[], ['Hello World!']]),
+    ([b'Line 1\r\nLine 2\r\n'], [['Line 1', 'Line 2']]),
+], ids=['single_line', 'multiple_lines', 'partial_line', 'carriage_return'])
+def test_read_stdout_buffers_complete_lines(fake_serial, chunks, expected):
+    """Each read buffers the completed lines; the buffer after every read is checked."""
+    mgr = fake_serial(chunks)
+    for lines in expected:
+        assert mgr.read_stdout() is True
+        assert mgr.get_stdout_buffer() == lines
+    assert mgr.read_stdout() is False
+
+
+def test_read_stdout_splits_crlf_lines_and_forwards(fake_serial, capsys):
+    """Several CRLF lines in one read are split, the tail is kept and lines are echoed on request."""
+    mgr = fake_serial([b'one\r\ntwo\r\nthr', b'ee\r\n'], forward_serial_stdio=True)
+
+    assert mgr.read_stdout() is True
+    assert mgr.get_stdout_buffer() == ['one', 'two']
+    assert mgr._partial_line == b'thr'
+    assert mgr.read_stdout() is True
+    assert mgr.get_stdout_buffer() == ['one', 'two', 'three']
+    assert mgr.read_stdout() is False
+    assert capsys.readouterr().out == 'Read: one\nRead: two\nRead: three\n'
+
+
+def test_read_stdout_reads_available_bytes_in_one_capped_call(monkeypatch):
+    """Pending bytes are taken with one read() per call, at most RX_READ_LIMIT at a time."""
+    class SerialBulk:
         def __init__(self, *a, **kw):
             self.is_open = True
-            self._data = b'Hello World\n'
+            self._data = b'x' * 9 + b'\n'
+            self.sizes = []
 
         @property
         def in_waiting(self):
             return len(self._data)
 
         def read(self, size):
+            self.sizes.append(size)
             data = self._data[:size]
             self._data = self._data[size:]
             return data
@@ -125,89 +356,42 @@ def test_read_stdout_with_single_line(monkeypatch):
         def write(self, data):
             pass
 
-    monkeypatch.setattr(sm, 'serial', type('X', (), {'Serial': SerialWithData}))
+    _patch_serial(monkeypatch, SerialBulk)
+    monkeypatch.setattr(sm, 'RX_READ_LIMIT', 6)
     mgr = sm.SerialManager()
     assert mgr.connect() is True
-    result = mgr.read_stdout()
-    assert result is True
-    buffer = mgr.get_stdout_buffer()
-    assert len(buffer) == 1
-    assert buffer[0] == 'Hello World'
+    assert mgr.read_stdout() is True
+    assert mgr.read_stdout() is True
+    assert mgr.read_stdout() is False
+    assert mgr.ser.sizes == [6, 4]
+    assert mgr.get_stdout_buffer() == ['x' * 9]
 
 
-def test_read_stdout_with_multiple_lines(monkeypatch):
-    """Test reading multiple lines from stdout."""
-    class SerialWithMultipleLines:
+def test_read_stdout_drains_without_consumer(monkeypatch):
+    """Without stdout buffer, forwarding or logger the input is discarded undecoded."""
+    class SerialPending:
         def __init__(self, *a, **kw):
             self.is_open = True
-            self._data = b'Line 1\nLine 2\nLine 3\n'
-
-        @property
-        def in_waiting(self):
-            return len(self._data)
+            self.in_waiting = 12
+            self.resets = 0
 
         def read(self, size):
-            data = self._data[:size]
-            self._data = self._data[size:]
-            return data
+            raise AssertionError('output must not be read')
 
-        def write(self, data):
-            pass
-
-    monkeypatch.setattr(sm, 'serial', type('X', (), {'Serial': SerialWithMultipleLines}))
-    mgr = sm.SerialManager()
-    assert mgr.connect() is True
-    result = mgr.read_stdout()
-    assert result is True
-    buffer = mgr.get_stdout_buffer()
-    assert len(buffer) == 3
-    assert buffer[0] == 'Line 1'
-    assert buffer[1] == 'Line 2'
-    assert buffer[2] == 'Line 3'
-
-
-def test_read_stdout_with_partial_line(monkeypatch):
-    """Test that partial lines are buffered correctly."""
-    class SerialWithPartialLine:
-        def __init__(self, *a, **kw):
-            self.is_open = True
-            self._calls = 0
-
-        @property
-        def in_waiting(self):
-            if self._calls == 0:
-                return 10
-            elif self._calls == 1:
-                return 7
-            return 0
-
-        def read(self, size):
-            self._calls += 1
-            if self._calls == 1:
-                return b'Hello Wor'
-            elif self._calls == 2:
-                return b'ld!\n'
-            return b''
+        def reset_input_buffer(self):
+            self.resets += 1
+            self.in_waiting = 0
 
         def write(self, data):
             pass
 
-    monkeypatch.setattr(sm, 'serial', type('X', (), {'Serial': SerialWithPartialLine}))
-    mgr = sm.SerialManager()
+    _patch_serial(monkeypatch, SerialPending)
+    mgr = sm.SerialManager(stdout_buffer_size=0)
     assert mgr.connect() is True
-    
-    # First read gets partial line
-    result1 = mgr.read_stdout()
-    assert result1 is True
-    buffer1 = mgr.get_stdout_buffer()
-    assert len(buffer1) == 0  # No complete lines yet
-    
-    # Second read completes the line
-    result2 = mgr.read_stdout()
-    assert result2 is True
-    buffer2 = mgr.get_stdout_buffer()
-    assert len(buffer2) == 1
-    assert buffer2[0] == 'Hello World!'
+    assert mgr.read_stdout() is True
+    assert mgr.ser.resets == 1
+    assert mgr.read_stdout() is False
+    assert mgr.get_stdout_buffer() == []
 
 
 def test_read_stdout_handles_exception(monkeypatch):
@@ -226,7 +410,7 @@ def test_read_stdout_handles_exception(monkeypatch):
         def write(self, data):
             pass
 
-    monkeypatch.setattr(sm, 'serial', type('X', (), {'Serial': SerialReadFail}))
+    _patch_serial(monkeypatch, SerialReadFail)
     mgr = sm.SerialManager(min_backoff=0.01, max_backoff=0.02)
     assert mgr.connect() is True
     result = mgr.read_stdout()
@@ -237,7 +421,7 @@ def test_read_stdout_handles_exception(monkeypatch):
 
 def test_get_stdout_buffer_with_max_lines(monkeypatch):
     """Test retrieving limited number of lines from buffer."""
-    monkeypatch.setattr(sm, 'serial', type('X', (), {'Serial': DummySerialOK}))
+    _patch_serial(monkeypatch, DummySerialOK)
     mgr = sm.SerialManager(stdout_buffer_size=10)
     
     # Manually add lines to buffer for testing
@@ -254,7 +438,7 @@ def test_get_stdout_buffer_with_max_lines(monkeypatch):
 
 def test_stdout_buffer_overflow(monkeypatch):
     """Test that buffer respects max size and drops old lines."""
-    monkeypatch.setattr(sm, 'serial', type('X', (), {'Serial': DummySerialOK}))
+    _patch_serial(monkeypatch, DummySerialOK)
     mgr = sm.SerialManager(stdout_buffer_size=3)
     
     # Add more lines than buffer size
@@ -271,82 +455,50 @@ def test_stdout_buffer_overflow(monkeypatch):
 
 def test_clear_stdout_buffer(monkeypatch):
     """Test clearing the stdout buffer."""
-    monkeypatch.setattr(sm, 'serial', type('X', (), {'Serial': DummySerialOK}))
+    _patch_serial(monkeypatch, DummySerialOK)
     mgr = sm.SerialManager()
     
     # Add some lines
     mgr.stdout_buffer.append('Line 1')
     mgr.stdout_buffer.append('Line 2')
-    mgr._partial_line = 'Partial'
+    mgr._partial_line += b'Partial'
     
     # Clear
     mgr.clear_stdout_buffer()
     
     assert len(mgr.stdout_buffer) == 0
-    assert mgr._partial_line == ''
-
-
-def test_read_stdout_with_carriage_return(monkeypatch):
-    """Test that carriage returns are stripped properly."""
-    class SerialWithCR:
-        def __init__(self, *a, **kw):
-            self.is_open = True
-            self._data = b'Line 1\r\nLine 2\r\n'
-
-        @property
-        def in_waiting(self):
-            return len(self._data)
-
-        def read(self, size):
-            data = self._data[:size]
-            self._data = self._data[size:]
-            return data
-
-        def write(self, data):
-            pass
-
-    monkeypatch.setattr(sm, 'serial', type('X', (), {'Serial': SerialWithCR}))
-    mgr = sm.SerialManager()
-    assert mgr.connect() is True
-    result = mgr.read_stdout()
-    assert result is True
-    buffer = mgr.get_stdout_buffer()
-    assert len(buffer) == 2
-    assert buffer[0] == 'Line 1'
-    assert buffer[1] == 'Line 2'
+    assert mgr._partial_line == b''
 
 
 def test_send_relax_command_success(monkeypatch):
     """Test sending RELAX command and receiving acknowledgment."""
-    class SerialWithRelaxAck:
-        def __init__(self, *a, **kw):
-            self.is_open = True
-            self._written = []
-            self._response = b'ACK_RELAX\n'
-
-        def write(self, data):
-            self._written.append(data)
-
-        @property
-        def in_waiting(self):
-            return len(self._response)
-
-        def read(self, size):
-            data = self._response[:size]
-            self._response = self._response[size:]
-            return data
-
-        def close(self):
-            self.is_open = False
-
-    monkeypatch.setattr(sm, 'serial', type('X', (), {'Serial': SerialWithRelaxAck}))
+    _patch_serial(monkeypatch, DummySerialRelaxAck)
     mgr = sm.SerialManager()
     assert mgr.connect() is True
     
     # Send RELAX command
     result = mgr.send_relax_command(timeout=0.5)
     assert result is True
-    assert mgr.ser._written[0] == b'RELAX\n'
+    assert mgr.ser.written[0] == b'RELAX\n'
+    assert mgr.ser.timeout == 1.0
+    # lines up to and including the acknowledgment went through the normal buffer
+    assert mgr.get_stdout_buffer() == [
+        'I: RELAX received, exiting main loop',
+        'I: Main loop ended, relaxing servos',
+        'I: ACK_RELAX',
+    ]
+    assert mgr._partial_line == b''
+
+
+def test_send_relax_command_needs_the_whole_ack_line(monkeypatch):
+    """Lines merely containing ACK_RELAX (before the servos are relaxed) are not the acknowledgment."""
+    class SerialEarlyAckOnly(DummySerialRelaxAck):
+        RESPONSE = b'I: ACK_RELAX received, exiting main loop\r\nI: ACK_RELAX pending'
+
+    _patch_serial(monkeypatch, SerialEarlyAckOnly)
+    mgr = sm.SerialManager()
+    assert mgr.connect() is True
+    assert mgr.send_relax_command(timeout=0.1) is False
 
 
 def test_send_relax_command_timeout(monkeypatch):
@@ -355,21 +507,21 @@ def test_send_relax_command_timeout(monkeypatch):
         def __init__(self, *a, **kw):
             self.is_open = True
             self._written = []
+            self.timeout = 1.0
+            self.read_timeouts = []
 
         def write(self, data):
             self._written.append(data)
 
-        @property
-        def in_waiting(self):
-            return 0
-
-        def read(self, size):
+        def read_until(self, expected, size):
+            # blocking read that times out without data
+            self.read_timeouts.append(self.timeout)
             return b''
 
         def close(self):
             self.is_open = False
 
-    monkeypatch.setattr(sm, 'serial', type('X', (), {'Serial': SerialNoAck}))
+    _patch_serial(monkeypatch, SerialNoAck)
     mgr = sm.SerialManager()
     assert mgr.connect() is True
     
@@ -377,11 +529,15 @@ def test_send_relax_command_timeout(monkeypatch):
     result = mgr.send_relax_command(timeout=0.1)
     assert result is False
     assert mgr.ser._written[0] == b'RELAX\n'
+    # a single blocking read instead of polling, prior timeout restored
+    assert len(mgr.ser.read_timeouts) == 1
+    assert 0 < mgr.ser.read_timeouts[0] <= 0.1
+    assert mgr.ser.timeout == 1.0
 
 
 def test_send_relax_command_not_connected(monkeypatch):
     """Test sending RELAX command when not connected."""
-    monkeypatch.setattr(sm, 'serial', type('X', (), {'Serial': DummySerialFail}))
+    _patch_serial(monkeypatch, DummySerialFail)
     mgr = sm.SerialManager(min_backoff=0.01, max_backoff=0.02)
     assert mgr.connect() is False
     
@@ -392,48 +548,24 @@ def test_send_relax_command_not_connected(monkeypatch):
 
 def test_close_method_sends_relax(monkeypatch):
     """Test that close method sends RELAX command."""
-    written_data = []
-    
-    class SerialWithRelaxAck:
-        def __init__(self, *a, **kw):
-            self.is_open = True
-            self._response = b'ACK_RELAX\n'
-            self._closed = False
-
-        def write(self, data):
-            written_data.append(data)
-
-        @property
-        def in_waiting(self):
-            return len(self._response) if not self._closed else 0
-
-        def read(self, size):
-            if self._closed:
-                return b''
-            data = self._response[:size]
-            self._response = self._response[size:]
-            return data
-
-        def close(self):
-            self._closed = True
-            self.is_open = False
-
-    monkeypatch.setattr(sm, 'serial', type('X', (), {'Serial': SerialWithRelaxAck}))
+    _patch_serial(monkeypatch, DummySerialRelaxAck)
     mgr = sm.SerialManager()
     assert mgr.connect() is True
+    ser = mgr.ser
     
     # Close the manager
     mgr.close()
     
-    # Verify RELAX was sent (captured in outer scope)
-    assert len(written_data) > 0
-    assert written_data[0] == b'RELAX\n'
+    # Verify RELAX was sent and the port closed
+    assert len(ser.written) > 0
+    assert ser.written[0] == b'RELAX\n'
+    assert ser.is_open is False
     assert mgr.ser is None
 
 
 def test_close_method_when_not_connected(monkeypatch):
     """Test that close method handles not being connected."""
-    monkeypatch.setattr(sm, 'serial', type('X', (), {'Serial': DummySerialFail}))
+    _patch_serial(monkeypatch, DummySerialFail)
     mgr = sm.SerialManager(min_backoff=0.01, max_backoff=0.02)
     assert mgr.connect() is False
     